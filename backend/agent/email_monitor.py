@@ -11,6 +11,9 @@ from .smart_email_job_matcher import SmartEmailJobMatcher
 
 logger = logging.getLogger(__name__)
 
+# Emails without a job application are marked processed in batches of this size
+PROCESSED_MARK_CHUNK_SIZE = 50
+
 class EmailMonitor:
     def __init__(self, db_manager: DatabaseManager, email_processor: EmailProcessor):
         self.db_manager = db_manager
@@ -93,35 +96,53 @@ class EmailMonitor:
             new_applications = 0
             updated_applications = 0
             
-            for email in emails:
-                try:
-                    # Check if email was already processed
-                    if await self._is_email_processed(email['id']):
-                        continue
+            # Look up which emails were already processed in one batch, off the event loop
+            processed_ids = await asyncio.to_thread(
+                self.db_manager.filter_processed, [email['id'] for email in emails]
+            )
+            
+            # Emails that changed nothing are marked together in chunks; re-reading
+            # one after a crash only costs another analysis
+            newly_processed_ids = []
+            try:
+                for email in emails:
+                    try:
+                        # Check if email was already processed
+                        if email['id'] in processed_ids:
+                            continue
 
-                    # Process the email for job application content
-                    email_analysis = await self.email_processor.process_email(email)
+                        # Process the email for job application content
+                        email_analysis = await self.email_processor.process_email(email)
                     
-                    if email_analysis and email_analysis.get('is_job_application'):
-                        # NEW LOGIC: Try to match to existing job first
-                        matched_job = await self._find_matching_job(email_analysis, email)
+                        if email_analysis and email_analysis.get('is_job_application'):
+                            # NEW LOGIC: Try to match to existing job first
+                            matched_job = await self._find_matching_job(email_analysis, email)
                         
-                        if matched_job:
-                            # UPDATE existing job application
-                            updated_app = await self._update_existing_application(matched_job, email_analysis, email)
-                            updated_applications += 1
-                            logger.info(f"📝 Updated existing application {matched_job['id']}: {matched_job['company']} - {matched_job['position']}")
-                        else:
-                            # CREATE new application (original behavior)
-                            app_id = await self._create_new_application(email_analysis, email)
-                            new_applications += 1
-                            logger.info(f"📋 Created new application: {email_analysis['company']} - {email_analysis['position']}")
+                            if matched_job:
+                                # UPDATE existing job application
+                                updated_app = await self._update_existing_application(matched_job, email_analysis, email)
+                                updated_applications += 1
+                                logger.info(f"📝 Updated existing application {matched_job['id']}: {matched_job['company']} - {matched_job['position']}")
+                            else:
+                                # CREATE new application (original behavior)
+                                app_id = await self._create_new_application(email_analysis, email)
+                                new_applications += 1
+                                logger.info(f"📋 Created new application: {email_analysis['company']} - {email_analysis['position']}")
 
-                    # Mark email as processed regardless
-                    await self._mark_email_processed(email['id'])
+                            # Marked at once so a crash can't ingest this email again as a duplicate
+                            await self.db_manager.mark_email_processed(email['id'])
+                            continue
+
+                        # Nothing was written for this email; mark it with the next chunk
+                        newly_processed_ids.append(email['id'])
+                        if len(newly_processed_ids) >= PROCESSED_MARK_CHUNK_SIZE:
+                            await self.db_manager.mark_emails_processed(newly_processed_ids)
+                            newly_processed_ids = []
                     
-                except Exception as e:
-                    logger.error(f"❌ Error processing email {email.get('id', 'unknown')}: {e}")
+                    except Exception as e:
+                        logger.error(f"❌ Error processing email {email.get('id', 'unknown')}: {e}")
+            finally:
+                await self.db_manager.mark_emails_processed(newly_processed_ids)
 
             if new_applications > 0 or updated_applications > 0:
                 # Update and broadcast statistics
@@ -279,14 +300,6 @@ class EmailMonitor:
 
     # ... rest of existing methods stay the same ...
 
-    async def _is_email_processed(self, email_id: str) -> bool:
-        """Check if an email has already been processed"""
-        return await self.db_manager.is_email_processed(email_id)
-
-    async def _mark_email_processed(self, email_id: str):
-        """Mark an email as processed"""
-        await self.db_manager.mark_email_processed(email_id)
-
     async def update_application_status(self, app_id: int, new_status: str):
         """Update application status and broadcast change"""
         try:
@@ -1,14 +1,38 @@
 # backend/agent/smart_email_job_matcher.py
 
 import re
+import sys
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from database.database_manager import DatabaseManager
+from config.matching_config import matching_config
 
 logger = logging.getLogger(__name__)
 
+# Normalization patterns are compiled once at import instead of per comparison
+_COMPANY_SUFFIX_RE = re.compile(r'\b(inc|llc|corp|corporation|company|ltd|limited)\b')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_POSITION_NOISE_RE = re.compile(r'\b(position|role|job|opening|opportunity)\b')
+
+
+@lru_cache(maxsize=4096)
+def normalize_company_name(company: str) -> str:
+    """Lowercase, strip legal suffixes and then punctuation, and collapse whitespace"""
+    # Suffixes go first, so "Johnson&Company" still loses "company" at the "&" boundary
+    normalized = _NON_WORD_RE.sub('', _COMPANY_SUFFIX_RE.sub('', company.lower()))
+    return sys.intern(' '.join(normalized.split()))
+
+
+@lru_cache(maxsize=4096)
+def normalize_position_title(position: str) -> str:
+    """Lowercase, drop noise words that don't affect matching, and collapse whitespace"""
+    normalized = _POSITION_NOISE_RE.sub('', position.lower())
+    return sys.intern(' '.join(normalized.split()))
+
+
 class SmartEmailJobMatcher:
     """
     Enhanced matcher for linking emails to existing job applications
@@ -16,6 +40,7 @@ class SmartEmailJobMatcher:
     
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
+        self.config = matching_config
         self.time_window_days = 45  # Look back 45 days for potential matches
         self.company_similarity_threshold = 0.7
         self.position_similarity_threshold = 0.6
@@ -48,6 +73,10 @@ class SmartEmailJobMatcher:
                 logger.debug("No recent job applications found for matching")
                 return []
             
+            # Bind the threshold checks once for the scoring loop
+            can_still_reach = self.config.can_still_reach
+            should_suggest_match = self.config.should_suggest_match
+            
             matches = []
             for job in recent_jobs:
                 confidence = 0
@@ -61,6 +90,11 @@ class SmartEmailJobMatcher:
                     match_methods.append("company_name")
                     match_details['company_similarity'] = company_score
                 
+                # Components are scored from the largest possible contribution down,
+                # so a job that can no longer reach the threshold is dropped early
+                if not can_still_reach(confidence, 1):
+                    continue
+                
                 # 2. Position Title Matching (40 points)
                 if position:
                     position_score = self._calculate_position_match(position, job.position)
@@ -69,6 +103,9 @@ class SmartEmailJobMatcher:
                         match_methods.append("position_title")
                         match_details['position_similarity'] = position_score
                 
+                if not can_still_reach(confidence, 2):
+                    continue
+                
                 # 3. Email Domain Matching (30 points)
                 domain_score = self._calculate_domain_match(sender, job.company)
                 if domain_score > 0:
@@ -76,6 +113,9 @@ class SmartEmailJobMatcher:
                     match_methods.append("email_domain")
                     match_details['domain_match'] = True
                 
+                if not can_still_reach(confidence, 3):
+                    continue
+                
                 # 4. Subject Line Keywords (20 points)
                 subject_score = self._calculate_subject_match(subject, job.company, job.position)
                 if subject_score > 0:
@@ -83,13 +123,16 @@ class SmartEmailJobMatcher:
                     match_methods.append("subject_keywords")
                     match_details['subject_keywords'] = subject_score
                 
+                if not can_still_reach(confidence, 4):
+                    continue
+                
                 # 5. Recency Bonus (10 points max)
                 recency_score = self._calculate_recency_bonus(job.application_date)
                 confidence += recency_score
                 match_details['recency_bonus'] = recency_score
                 
                 # Only include matches above minimum threshold
-                if confidence >= 50:  # Minimum 50% confidence
+                if should_suggest_match(confidence):
                     matches.append({
                         'job_id': job.id,
                         'job': job.to_dict(),
@@ -126,6 +169,11 @@ class SmartEmailJobMatcher:
         email_clean = self._normalize_company_name(email_company)
         job_clean = self._normalize_company_name(job_company)
         
+        # A name made only of suffixes and punctuation normalizes to "", which
+        # every other name would contain
+        if not email_clean or not job_clean:
+            return 0.0
+        
         # Exact match
         if email_clean == job_clean:
             return 1.0
@@ -239,29 +287,13 @@ class SmartEmailJobMatcher:
         """Normalize company name for comparison"""
         if not company:
             return ''
-        
-        # Remove common suffixes and normalize
-        normalized = re.sub(r'\b(inc|llc|corp|corporation|company|ltd|limited)\b', '', company.lower())
-        normalized = re.sub(r'[^\w\s]', '', normalized)  # Remove punctuation
-        normalized = re.sub(r'\s+', ' ', normalized).strip()  # Normalize whitespace
-        
-        return normalized
+        return normalize_company_name(company)
 
     def _normalize_position_title(self, position: str) -> str:
         """Normalize position title for comparison"""
         if not position:
             return ''
-        
-        # Convert to lowercase and remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', position.lower().strip())
-        
-        # Remove common words that don't affect matching
-        noise_words = ['position', 'role', 'job', 'opening', 'opportunity']
-        for word in noise_words:
-            normalized = re.sub(rf'\b{word}\b', '', normalized)
-        
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return normalize_position_title(position)
 
     def _generate_match_explanation(self, job: Any, confidence: float, methods: List[str], details: Dict[str, Any]) -> str:
         """Generate human-readable explanation for the match"""
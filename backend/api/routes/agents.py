@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 import logging
 
-from database.database_manager import DatabaseManager
+from database.database_manager import db_manager
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ router = APIRouter()
 # Dependency to get database manager
 def get_db():
     """Dependency to get database manager"""
-    return DatabaseManager()
+    return db_manager
 
 
 # Request/Response Models
@@ -1,14 +1,31 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+import base64
+import json
 
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, db_manager
+from database.models import JobApplication
 
 router = APIRouter()
 
 def get_db():
     """Dependency to get database manager"""
-    return DatabaseManager()
+    return db_manager
+
+def encode_cursor(created_at: Optional[datetime], application_id: int) -> str:
+    """Encode the (created_at, id) keyset of the last application into an opaque cursor"""
+    payload = json.dumps([created_at.isoformat() if created_at else None, application_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        created_at, application_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (datetime.fromisoformat(created_at) if created_at else None, int(application_id))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 @router.get("/")
 async def get_applications(
@@ -17,36 +34,70 @@ async def get_applications(
     status: Optional[str] = Query(None),
     company: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    summary: bool = Query(False),
     db: DatabaseManager = Depends(get_db)
 ):
-    """Get job applications with optional filtering and pagination"""
+    """
+    Get job applications with optional filtering and pagination
+    
+    Pass the previous response's ``next_cursor`` as ``cursor`` to seek to the next
+    page; ``skip`` is still honoured when no cursor is given. ``summary=true``
+    leaves out job descriptions, notes and extraction data (returned as null).
+    """
     try:
-        # Get total count with the same filters
-        total_count = db.get_applications_count(
-            status=status,
-            company=company,
-            search=search
-        )
+        after = decode_cursor(cursor) if cursor else None
         
-        applications = db.get_applications(
+        # Page and total count with the same filters, in one query when possible
+        applications, total_count = await db.get_applications_page(
             skip=skip, 
             limit=limit, 
             status=status, 
             company=company, 
-            search=search
+            search=search,
+            after=after,
+            summary=summary
         )
         
+        next_cursor = None
+        if len(applications) == limit:
+            last = applications[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        
         # Convert to dictionaries for JSON response
         return {
-            "applications": [app.to_dict() for app in applications],
+            "applications": [JobApplication.row_to_dict(app) for app in applications],
             "total": total_count,
             "skip": skip,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving applications: {str(e)}")
 
+@router.get("/export")
+async def export_applications(
+    status: Optional[str] = Query(None),
+    company: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    summary: bool = Query(False),
+    db: DatabaseManager = Depends(get_db)
+):
+    """
+    Export every matching application as newline-delimited JSON
+    
+    Rows are streamed from the database as they are written, so large exports
+    never hold the whole result in memory.
+    """
+    rows = db.iter_applications(status=status, company=company, search=search, summary=summary)
+    return StreamingResponse(
+        (json.dumps(row) + "\n" for row in rows),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/{application_id}")
 async def get_application(
     application_id: int, 
@@ -133,7 +184,7 @@ async def add_manual_application(
         if "status" not in application_data:
             application_data["status"] = "applied"
             
-        application_id = db.add_application(application_data)
+        application_id = await db.add_application(application_data)
         return {"id": application_id, "message": "Application added successfully"}
         
     except HTTPException:
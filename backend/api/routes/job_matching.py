@@ -6,7 +6,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
 
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, db_manager
 from agent.smart_email_job_matcher import SmartEmailJobMatcher
 from services.websocket_manager import manager as websocket_manager
 
@@ -36,7 +36,7 @@ class JobMatchResponse(BaseModel):
 # Dependency to get database manager and matcher
 def get_db():
     """Dependency to get database manager"""
-    return DatabaseManager()
+    return db_manager
 
 def get_matcher(db: DatabaseManager = Depends(get_db)):
     return SmartEmailJobMatcher(db)
@@ -56,7 +56,7 @@ async def update_application_status_enhanced(
         logger.info(f"📝 Updating application {application_id} status to: {status_update.status}")
         
         # Get current application
-        current_app = db.get_application_by_id(application_id)
+        current_app = await db.get_application_by_id(application_id)
         if not current_app:
             raise HTTPException(status_code=404, detail="Application not found")
         
@@ -201,37 +201,37 @@ async def merge_duplicate_applications(
         
         logger.info(f"🔄 Merging applications: keeping {primary_id}, removing {duplicate_ids}")
         
-        # Get primary application
-        primary_app = db.get_application_by_id(primary_id)
+        # Get primary and duplicate applications in one lookup
+        applications = db.get_applications_by_ids([primary_id, *duplicate_ids])
+        primary_app = applications.get(primary_id)
         if not primary_app:
             raise HTTPException(status_code=404, detail="Primary application not found")
         
         # Merge data from duplicates into primary
         merged_notes = primary_app.get('notes', '')
         
-        for dup_id in duplicate_ids:
-            dup_app = db.get_application_by_id(dup_id)
-            if dup_app:
-                # Merge notes
-                dup_notes = dup_app.get('notes', '')
-                if dup_notes and dup_notes not in merged_notes:
-                    merged_notes += f"\n\n[MERGED FROM APP {dup_id}]\n{dup_notes}"
-                
-                # Transfer any email links
-                email_links = await db.get_email_job_links_for_application(dup_id)
-                for link in email_links:
-                    # Update link to point to primary application
-                    await db.update_email_job_link_job_id(link['id'], primary_id)
-                
-                # Delete duplicate application
-                await db.delete_application(dup_id)
-        
-        # Update primary application with merged notes
-        if merged_notes != primary_app.get('notes', ''):
-            await db.update_application_notes(primary_id, merged_notes)
+        # One transaction for the whole merge, so a failure leaves nothing half-moved
+        async with db.async_session_scope() as session:
+            for dup_id in duplicate_ids:
+                dup_app = applications.get(dup_id)
+                if dup_app:
+                    # Merge notes
+                    dup_notes = dup_app.get('notes', '')
+                    if dup_notes and dup_notes not in merged_notes:
+                        merged_notes += f"\n\n[MERGED FROM APP {dup_id}]\n{dup_notes}"
+                    
+                    # Transfer any email links to the primary application
+                    await db.reassign_email_job_links(dup_id, primary_id, session=session)
+                    
+                    # Delete duplicate application
+                    await db.delete_application(dup_id, session=session)
+            
+            # Update primary application with merged notes
+            if merged_notes != primary_app.get('notes', ''):
+                await db.update_application_notes(primary_id, merged_notes, session=session)
         
         # Get updated primary application
-        updated_primary = db.get_application_by_id(primary_id)
+        updated_primary = await db.get_application_by_id(primary_id)
         
         # Broadcast updates
         await websocket_manager.broadcast({
@@ -268,7 +268,7 @@ async def get_application_history(
     """
     try:
         # Get application details
-        application = db.get_application_by_id(application_id)
+        application = await db.get_application_by_id(application_id)
         if not application:
             raise HTTPException(status_code=404, detail="Application not found")
         
@@ -347,7 +347,7 @@ async def find_potential_email_matches(
     Find emails that might belong to this application
     """
     try:
-        application = db.get_application_by_id(application_id)
+        application = await db.get_application_by_id(application_id)
         if not application:
             raise HTTPException(status_code=404, detail="Application not found")
         
@@ -7,7 +7,7 @@ import os
 from datetime import datetime
 from pydantic import BaseModel, field_validator
 
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, db_manager
 from services.websocket_manager import manager as websocket_manager
 from openai import AsyncOpenAI
 
@@ -24,7 +24,7 @@ except Exception as e:
 
 
 def get_db():
-    return DatabaseManager()
+    return db_manager
 
 
 async def extract_salary_from_description(job_description: str) -> Optional[str]:
@@ -300,7 +300,7 @@ async def check_duplicate_job(
     """
     try:
         # Search for existing jobs with same URL
-        existing_jobs = db.get_applications(limit=1000)  # Get all for duplicate check
+        existing_jobs = db.get_application_summaries(limit=1000)
         
         for job in existing_jobs:
             # Check exact URL match first
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, HTTPException, Depends
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, db_manager
 
 router = APIRouter()
 
 def get_db():
     """Dependency to get database manager"""
-    return DatabaseManager()
+    return db_manager
 
 @router.get("/")
 async def get_statistics(db: DatabaseManager = Depends(get_db)):
@@ -5,10 +5,42 @@ Configuration for the email-to-job matching system.
 Adjust these settings based on your specific needs.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Tuple, FrozenSet
 import os
 
+# Default lookup data shared by every MatchingConfig instance
+_HR_DOMAINS = frozenset({
+    'greenhouse.io',
+    'lever.co',
+    'workday.com',
+    'bamboohr.com',
+    'jobvite.com',
+    'smartrecruiters.com',
+    'recruiterbox.com',
+    'breezy.hr',
+    'ashbyhq.com',
+    'teamtailor.com'
+})
+
+_COMPANY_SUFFIXES = frozenset({
+    'inc', 'llc', 'corp', 'corporation', 'company',
+    'ltd', 'limited', 'co', 'technologies', 'tech',
+    'systems', 'solutions', 'services', 'group'
+})
+
+_POSITION_NOISE_WORDS = frozenset({
+    'position', 'role', 'job', 'opening', 'opportunity',
+    'candidate', 'professional', 'specialist', 'expert'
+})
+
+_STATUS_PROGRESSION = (
+    'captured', 'applied', 'assessment', 'interview', 'offer', 'accepted'
+)
+
+_TERMINAL_STATUSES = frozenset({'rejected', 'withdrawn', 'accepted'})
+
+
 @dataclass
 class MatchingConfig:
     """Configuration for email-job matching algorithm"""
@@ -46,63 +78,50 @@ class MatchingConfig:
     recency_older: int = 2
     
     # Known HR/recruitment platforms
-    hr_domains: List[str] = None
+    hr_domains: FrozenSet[str] = _HR_DOMAINS
     
     # Company name normalization rules
-    company_suffixes_to_remove: List[str] = None
+    company_suffixes_to_remove: FrozenSet[str] = _COMPANY_SUFFIXES
     
     # Position title noise words to ignore
-    position_noise_words: List[str] = None
+    position_noise_words: FrozenSet[str] = _POSITION_NOISE_WORDS
     
-    # Status progression rules
-    status_progression: List[str] = None
-    terminal_statuses: List[str] = None
+    # Status progression rules (ordered)
+    status_progression: Tuple[str, ...] = _STATUS_PROGRESSION
+    terminal_statuses: FrozenSet[str] = _TERMINAL_STATUSES
+    
+    # Maximum points each scoring component can contribute, ordered from the
+    # largest contribution down (company, position, domain, subject, recency)
+    component_max_scores: Tuple[int, ...] = field(init=False, repr=False)
     
     def __post_init__(self):
-        """Initialize default lists if not provided"""
-        if self.hr_domains is None:
-            self.hr_domains = [
-                'greenhouse.io',
-                'lever.co', 
-                'workday.com',
-                'bamboohr.com',
-                'jobvite.com',
-                'smartrecruiters.com',
-                'recruiterbox.com',
-                'breezy.hr',
-                'ashbyhq.com',
-                'teamtailor.com'
-            ]
-        
-        if self.company_suffixes_to_remove is None:
-            self.company_suffixes_to_remove = [
-                'inc', 'llc', 'corp', 'corporation', 'company', 
-                'ltd', 'limited', 'co', 'technologies', 'tech',
-                'systems', 'solutions', 'services', 'group'
-            ]
-        
-        if self.position_noise_words is None:
-            self.position_noise_words = [
-                'position', 'role', 'job', 'opening', 'opportunity',
-                'candidate', 'professional', 'specialist', 'expert'
-            ]
+        """Derive the scoring bounds used for early rejection"""
+        self.component_max_scores = (
+            self.company_exact_match_score,
+            self.position_exact_match_score,
+            self.domain_exact_match_score,
+            self.subject_max_score,
+            self.recency_1_week,
+        )
+        # _remaining_max[i] is the most the components from index i onward can still add
+        remaining = [0] * (len(self.component_max_scores) + 1)
+        for i in range(len(self.component_max_scores) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + self.component_max_scores[i]
+        self._remaining_max = tuple(remaining)
         
-        if self.status_progression is None:
-            self.status_progression = [
-                'captured', 'applied', 'assessment', 'interview', 'offer', 'accepted'
-            ]
-        
-        if self.terminal_statuses is None:
-            self.terminal_statuses = ['rejected', 'withdrawn', 'accepted']
+        # Thresholds paired with their level, highest first. Set thresholds through
+        # the constructor so this stays in sync.
+        self._confidence_levels = tuple(sorted(
+            [(self.auto_update_threshold, "high"), (self.manual_review_threshold, "medium")],
+            reverse=True
+        ))
 
     def get_confidence_level(self, score: float) -> str:
         """Get human-readable confidence level"""
-        if score >= self.auto_update_threshold:
-            return "high"
-        elif score >= self.manual_review_threshold:
-            return "medium"
-        else:
-            return "low"
+        for threshold, level in self._confidence_levels:
+            if score >= threshold:
+                return level
+        return "low"
     
     def should_auto_update(self, score: float) -> bool:
         """Check if score is high enough for automatic update"""
@@ -111,25 +130,32 @@ class MatchingConfig:
     def should_suggest_match(self, score: float) -> bool:
         """Check if score warrants manual review"""
         return score >= self.manual_review_threshold
+    
+    def can_still_reach(self, current: float, remaining_idx: int) -> bool:
+        """Check if a partial score can still reach the manual review threshold
+        once the components from ``remaining_idx`` onward are scored"""
+        return current + self._remaining_max[remaining_idx] >= self.manual_review_threshold
 
 
 # Environment-based configuration
 def get_matching_config() -> MatchingConfig:
     """Get configuration based on environment variables"""
-    config = MatchingConfig()
-    
     # Override from environment variables
-    config.time_window_days = int(os.getenv('MATCHING_TIME_WINDOW_DAYS', 45))
-    config.auto_update_threshold = float(os.getenv('MATCHING_AUTO_THRESHOLD', 75.0))
-    config.manual_review_threshold = float(os.getenv('MATCHING_MANUAL_THRESHOLD', 50.0))
+    time_window_days = int(os.getenv('MATCHING_TIME_WINDOW_DAYS', 45))
+    auto_update_threshold = float(os.getenv('MATCHING_AUTO_THRESHOLD', 75.0))
+    manual_review_threshold = float(os.getenv('MATCHING_MANUAL_THRESHOLD', 50.0))
     
     # Debug mode - lower thresholds for testing
     if os.getenv('MATCHING_DEBUG_MODE', 'false').lower() == 'true':
-        config.auto_update_threshold = 60.0
-        config.manual_review_threshold = 30.0
+        auto_update_threshold = 60.0
+        manual_review_threshold = 30.0
         print("🐛 Debug mode: Using lower matching thresholds")
     
-    return config
+    return MatchingConfig(
+        time_window_days=time_window_days,
+        auto_update_threshold=auto_update_threshold,
+        manual_review_threshold=manual_review_threshold
+    )
 
 
 # Pre-configured setups for different use cases
@@ -139,22 +165,22 @@ class MatchingPresets:
     @staticmethod
     def conservative() -> MatchingConfig:
         """Conservative matching - fewer false positives"""
-        config = MatchingConfig()
-        config.auto_update_threshold = 85.0
-        config.manual_review_threshold = 65.0
-        config.company_fuzzy_threshold = 0.8
-        config.position_fuzzy_threshold = 0.7
-        return config
+        return MatchingConfig(
+            auto_update_threshold=85.0,
+            manual_review_threshold=65.0,
+            company_fuzzy_threshold=0.8,
+            position_fuzzy_threshold=0.7
+        )
     
     @staticmethod
     def aggressive() -> MatchingConfig:
         """Aggressive matching - more matches, potentially more false positives"""
-        config = MatchingConfig()
-        config.auto_update_threshold = 65.0
-        config.manual_review_threshold = 40.0
-        config.company_fuzzy_threshold = 0.6
-        config.position_fuzzy_threshold = 0.5
-        return config
+        return MatchingConfig(
+            auto_update_threshold=65.0,
+            manual_review_threshold=40.0,
+            company_fuzzy_threshold=0.6,
+            position_fuzzy_threshold=0.5
+        )
     
     @staticmethod
     def balanced() -> MatchingConfig:
@@ -1,15 +1,28 @@
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Get the backend directory path
 BACKEND_DIR = Path(__file__).parent.parent
 DATABASE_PATH = BACKEND_DIR / "database.db"
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
     # Database
     database_url: str = f"sqlite:///{DATABASE_PATH}"
+    db_pool_size: int = 50  # split between the sync and async engines
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_query_cache_size: int = 1200  # compiled statements kept per engine
+    statistics_cache_ttl: int = 30  # seconds; 0 disables the statistics cache
     
     # API Settings
     api_host: str = "127.0.0.1"
@@ -28,14 +41,15 @@ class Settings(BaseSettings):
 
     # Email monitoring
     email_check_interval: int = 300  # 5 minutes
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once per process; later calls reuse the parsed instance"""
+    return Settings()
+
+
+settings = get_settings()
 
 # Print loaded environment variables for debugging (only in development)
 if settings.debug:
@@ -1,100 +1,598 @@
-from sqlalchemy import create_engine, and_, or_, func
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import create_engine, and_, or_, func, tuple_, update, insert, delete, case, select, lambda_stmt, exists, inspect, text, event, table, column, null
+from sqlalchemy.engine import Row, URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import sessionmaker, Session, Bundle, raiseload
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError, OperationalError
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterator, AsyncIterator
+from functools import lru_cache
+from collections import Counter, OrderedDict
+from itertools import groupby
+from contextlib import contextmanager, asynccontextmanager
+import asyncio
+import heapq
 import logging
+import sys
+import time
+import weakref
+
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
 
 from .models import Base, EmailJobLink, EmailRecord, JobApplication, EmailProcessingLog, ApplicationStatistics
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of email IDs checked per IN query in filter_processed
+PROCESSED_LOOKUP_CHUNK_SIZE = 500
+# Processed email IDs remembered in memory; the least recently seen are evicted first
+PROCESSED_CACHE_MAX_SIZE = 100_000
+# IDs seeded from the log at startup, leaving room for the ones processed afterwards
+PROCESSED_CACHE_SEED_SIZE = PROCESSED_CACHE_MAX_SIZE // 2
+
+# Dialect-specific INSERTs that support ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+# Columns selected for application and link listings; rows come back without ORM instrumentation
+_APPLICATION_COLUMNS = tuple(JobApplication.__table__.columns)
+_LINK_COLUMNS = tuple(EmailJobLink.__table__.columns)
+_LINK_COLUMN_NAMES = frozenset(column.key for column in _LINK_COLUMNS)
+# Listing columns with the large text columns replaced by NULL, so list views
+# that never show them skip the bytes while row_to_dict still finds every key
+_APPLICATION_TEXT_COLUMN_NAMES = frozenset({"job_description", "notes", "extraction_data"})
+_APPLICATION_LISTING_COLUMNS = tuple(
+    null().label(column.key) if column.key in _APPLICATION_TEXT_COLUMN_NAMES else column
+    for column in _APPLICATION_COLUMNS
+)
+# Identifying columns only, for scans that never read descriptions or notes
+_APPLICATION_SUMMARY_COLUMNS = (
+    JobApplication.id, JobApplication.company, JobApplication.position,
+    JobApplication.status, JobApplication.job_url, JobApplication.source_type,
+    JobApplication.created_at,
+)
+
+# Dashboard statistics are polled constantly, so results are reused for
+# settings.statistics_cache_ttl seconds. The cache is module level so every
+# DatabaseManager instance shares it. "key" is the data version the value was
+# computed from (see _statistics_key); "generation" counts invalidations, so
+# a recompute that overlapped a write does not store its result. The lock lets
+# one request recompute while concurrent ones wait for its result.
+_statistics_cache: Dict[str, Any] = {"value": None, "expires_at": 0.0, "key": None, "generation": 0}
+# asyncio locks belong to one event loop, so each loop gets its own
+_statistics_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+# Indexes replaced by a better-ordered one; dropped on startup so writes stop maintaining them
+_OBSOLETE_INDEXES = (
+    # Single-column link indexes covered by the primary key and the composite indexes
+    "ix_email_job_links_id",
+    "ix_email_job_links_email_id",
+    "ix_email_job_links_job_id",
+    "ix_email_job_links_confidence_score_is_rejected",
+    "ix_email_job_links_is_rejected_confidence_score",
+    "ix_job_applications_source_type_created_at",
+    "ix_job_applications_status_created_at",
+)
+
+# Statuses reported individually in the statistics
+STATISTICS_STATUSES = ["applied", "interview", "offer", "rejected", "assessment", "screening", "captured"]
+
+# Link confidence buckets, each up to (not including) the next bound
+CONFIDENCE_BUCKETS = {"very_low": 30, "low": 50, "medium": 70, "high": 85, "very_high": None}
+
+
+# Python 3.11+ parses a trailing 'Z' natively, so the string only needs rewriting on older versions
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        # Only a trailing 'Z' needs rewriting; leave other strings untouched
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+if CISO8601_AVAILABLE:
+    def _parse_iso_datetime(value: str) -> datetime:
+        # ciso8601 is strict about ISO 8601, so let fromisoformat handle what it rejects
+        try:
+            return ciso8601.parse_datetime(value)
+        except ValueError:
+            return _fromisoformat(value)
+else:
+    _parse_iso_datetime = _fromisoformat
+
+
+# Fallback formats for application dates that are not ISO 8601, tried in order
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S')
+
+
+@lru_cache(maxsize=2048)
+def _parse_date(value: str) -> Optional[datetime]:
+    """
+    Parse an application date string, or return None if no known format matches
+
+    Results are memoized: bulk imports repeat the same few date strings, and
+    datetimes are immutable so sharing them is safe.
+    """
+    try:
+        return _parse_iso_datetime(value)
+    except ValueError:
+        pass
+    
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _raise_on_lazy_load(execute_state):
+    """Turn stray lazy loads of any ORM SELECT into errors, so N+1 patterns fail loudly"""
+    if execute_state.is_select and not execute_state.is_column_load and not execute_state.is_relationship_load:
+        execute_state.statement = execute_state.statement.options(raiseload('*'))
+
+
+def _count_where(condition, label: str):
+    """Conditional COUNT aggregate, so several counters can share one SELECT"""
+    return func.sum(case((condition, 1), else_=0)).label(label)
+
+
+# SQLite's LIKE already ignores ASCII case, while ilike() compiles there to
+# lower(column) LIKE lower(pattern) and pays a lower() call per row
+_LIKE_IGNORES_CASE = make_url(settings.database_url).get_backend_name() == "sqlite"
+
+
+def _icontains(column, pattern: str):
+    """Case-insensitive LIKE of column against a _contains_pattern() pattern"""
+    if _LIKE_IGNORES_CASE:
+        return column.like(pattern, escape="\\")
+    return column.ilike(pattern, escape="\\")
+
+
+def _contains_pattern(term: str) -> str:
+    """ILIKE pattern matching term anywhere, with wildcards in term escaped"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# SQLite full-text shadow of the searchable columns. The trigram tokenizer
+# indexes every three-character run, so a quoted phrase MATCH finds
+# case-insensitive substrings, as the trigram GIN indexes do for ILIKE on PostgreSQL
+_SEARCH_TABLE = table(
+    "job_applications_search",
+    column("rowid"),
+    column("job_applications_search"),
+)
+_SEARCH_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS job_applications_search USING fts5("
+    "company, position, location, content='job_applications', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS job_applications_search_insert AFTER INSERT ON job_applications BEGIN "
+    "INSERT INTO job_applications_search(rowid, company, position, location) "
+    "VALUES (new.id, new.company, new.position, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS job_applications_search_delete AFTER DELETE ON job_applications BEGIN "
+    "INSERT INTO job_applications_search(job_applications_search, rowid, company, position, location) "
+    "VALUES ('delete', old.id, old.company, old.position, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS job_applications_search_update "
+    "AFTER UPDATE OF company, position, location ON job_applications BEGIN "
+    "INSERT INTO job_applications_search(job_applications_search, rowid, company, position, location) "
+    "VALUES ('delete', old.id, old.company, old.position, old.location); "
+    "INSERT INTO job_applications_search(rowid, company, position, location) "
+    "VALUES (new.id, new.company, new.position, new.location); END",
+)
+# Shorter terms have no trigram to look up and fall back to LIKE
+_SEARCH_MIN_LENGTH = 3
+
+
+def _search_query(term: str, column_name: Optional[str] = None) -> str:
+    """FTS5 query matching term as a substring, optionally in one column only"""
+    phrase = '"' + term.replace('"', '""') + '"'
+    return f"{column_name} : {phrase}" if column_name else phrase
+
+
+def _search_matches(query: str):
+    """Condition restricting job_applications to rows the search table matches"""
+    return JobApplication.id.in_(
+        select(_SEARCH_TABLE.c.rowid).where(
+            _SEARCH_TABLE.c.job_applications_search.op("MATCH")(query)
+        )
+    )
+
+
+def _filter_applications(stmt, status, company, search, source_type, job_board, search_index=False):
+    """
+    Extend a lambda statement over job_applications with the listing filters
+    
+    Each active filter adds a cached lambda, so every filter combination reuses
+    its compiled SQL; patterns are built outside the lambdas so only plain
+    values become bound parameters. With search_index, text filters long
+    enough to have trigrams are answered by the SQLite search table.
+    """
+    if status:
+        stmt += lambda s: s.where(JobApplication.status == status)
+    
+    if company and search_index and len(company) >= _SEARCH_MIN_LENGTH:
+        company_query = _search_query(company, "company")
+        stmt += lambda s: s.where(_search_matches(company_query))
+    elif company:
+        company_pattern = _contains_pattern(company)
+        stmt += lambda s: s.where(_icontains(JobApplication.company, company_pattern))
+    
+    if source_type:
+        stmt += lambda s: s.where(JobApplication.source_type == source_type)
+    
+    if job_board:
+        stmt += lambda s: s.where(JobApplication.job_board == job_board)
+    
+    if search and search_index and len(search) >= _SEARCH_MIN_LENGTH:
+        search_query = _search_query(search)
+        stmt += lambda s: s.where(_search_matches(search_query))
+    elif search:
+        search_pattern = _contains_pattern(search)
+        stmt += lambda s: s.where(
+            or_(
+                _icontains(JobApplication.company, search_pattern),
+                _icontains(JobApplication.position, search_pattern),
+                _icontains(JobApplication.location, search_pattern)
+            )
+        )
+    
+    return stmt
+
+
+def _confidence_bucket_columns() -> List:
+    """One conditional count per confidence bucket, so the histogram takes a single scan"""
+    columns = []
+    lower = None
+    for bucket, upper in CONFIDENCE_BUCKETS.items():
+        conditions = []
+        if lower is not None:
+            conditions.append(EmailJobLink.confidence_score >= lower)
+        if upper is not None:
+            conditions.append(EmailJobLink.confidence_score < upper)
+        columns.append(_count_where(and_(*conditions), bucket))
+        lower = upper
+    return columns
+
+
+# Fixed counters of the statistics application aggregate
+_SOURCE_AND_STATUS_COUNT_COLUMNS = (
+    _count_where(JobApplication.source_type == "extension", "extension"),
+    _count_where(JobApplication.source_type == "email", "email"),
+    *[_count_where(JobApplication.status == status, status) for status in STATISTICS_STATUSES],
+)
+
+
+def _invalidate_statistics_cache():
+    """Drop cached statistics after a write that changes them"""
+    _statistics_cache["value"] = None
+    _statistics_cache["expires_at"] = 0.0
+    _statistics_cache["key"] = None
+    _statistics_cache["generation"] += 1
+
+
+def _statistics_lock() -> asyncio.Lock:
+    """The statistics lock of the running event loop, created on first use"""
+    loop = asyncio.get_running_loop()
+    lock = _statistics_locks.get(loop)
+    if lock is None:
+        lock = _statistics_locks[loop] = asyncio.Lock()
+    return lock
+
+
+_IN_MEMORY_SQLITE_URLS = ("sqlite://", "sqlite:///:memory:")
+
+
+def _shared_database_url(database_url: str, name: str) -> str:
+    """
+    URL both engines of a DatabaseManager can open as the same database
+    
+    Each connection to a plain in-memory SQLite URL gets its own empty
+    database, so the sync and async engines would never see each other's
+    rows; a named shared-cache memory database is visible to every
+    connection in the process that opens it.
+    """
+    if database_url in _IN_MEMORY_SQLITE_URLS:
+        return f"sqlite:///file:{name}?mode=memory&cache=shared&uri=true"
+    return database_url
+
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Pool and statement cache configuration for create_engine, sized from settings
+    
+    Every DatabaseManager opens a sync and an async engine, so each gets half
+    of the configured pool; together they stay within db_pool_size +
+    db_max_overflow connections per process.
+    """
+    options: Dict[str, Any] = {"query_cache_size": settings.db_query_cache_size}
+    if database_url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+        if "mode=memory" in database_url:
+            # A memory database lives only while a connection to it stays open
+            options["poolclass"] = StaticPool
+            return options
+    else:
+        # Server connections can be dropped underneath the pool; file connections can't
+        options.update(pool_recycle=settings.db_pool_recycle, pool_pre_ping=True)
+    options.update(
+        pool_size=max(1, settings.db_pool_size // 2),
+        max_overflow=settings.db_max_overflow // 2,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    return options
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers don't block the writer, and fsync at checkpoints rather than every commit"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+# asyncio drivers used for the async engine when the configured URL names a sync one
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def _async_database_url(database_url: str) -> URL:
+    """Database URL for the async engine, swapping in an asyncio driver if needed"""
+    url = make_url(database_url)
+    async_driver = _ASYNC_DRIVERS.get(url.drivername)
+    return url.set(drivername=async_driver) if async_driver else url
+
+
 class DatabaseManager:
-    def __init__(self):
-        self.engine = create_engine(
-            settings.database_url,
-            connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    def __init__(self, strict_loads: bool = False):
+        """
+        Args:
+            strict_loads: Make implicit lazy loads raise on every session of this
+                manager, so N+1 patterns fail loudly. Off by default so a missed
+                lazy load never breaks production; test fixtures turn it on.
+        """
+        database_url = _shared_database_url(settings.database_url, f"job_tracker_{id(self)}")
+        self.engine = create_engine(database_url, **_engine_options(database_url))
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
+        if strict_loads:
+            # sessionmaker gives each factory its own Session subclass, so the guard
+            # stays on this manager; explicit joinedload/selectinload still win
+            event.listen(self.SessionLocal, "do_orm_execute", _raise_on_lazy_load)
+        # async methods run on their own engine so they never block the event loop;
+        # both engines point at the same database
+        self.async_engine = create_async_engine(
+            _async_database_url(database_url), **_engine_options(database_url)
         )
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.AsyncSessionLocal = async_sessionmaker(
+            self.async_engine, autoflush=False, expire_on_commit=False,
+            sync_session_class=self.SessionLocal.class_
+        )
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+            event.listen(self.async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        # Whether email_job_links has its unique (email_id, job_id) index; databases
+        # holding duplicate links predate it and cannot use it as a conflict target
+        self._unique_link_index = True
+        # Whether text filters can use the SQLite trigram search table; set by init_db
+        self._search_index = False
+        # Email IDs known to be processed, least recently seen first; log rows are
+        # never removed, so positives stay valid
+        self._processed_email_ids: "OrderedDict[str, None]" = OrderedDict()
+        # Set once the cache has been seeded with the most recently processed IDs
+        self._processed_cache_loaded = False
         
     def init_db(self):
         """Initialize database tables"""
         try:
             Base.metadata.create_all(bind=self.engine)
+            self._create_missing_indexes()
+            if self.engine.dialect.name == "sqlite":
+                self._search_index = self._create_search_index()
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
             raise
 
+    def _create_missing_indexes(self):
+        """Add model indexes to tables that create_all skipped because they already existed"""
+        with self.engine.begin() as connection:
+            # Taken before the drops, so replacing an index also refreshes planner statistics
+            existing = self._index_names(connection)
+            for name in _OBSOLETE_INDEXES:
+                connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            for model_table in Base.metadata.sorted_tables:
+                for index in model_table.indexes:
+                    try:
+                        with connection.begin_nested():
+                            index.create(connection, checkfirst=True)
+                    except IntegrityError as e:
+                        # A unique index cannot be added over rows that already collide
+                        logger.warning(f"Could not create index {index.name}: {e}")
+            
+            index_names = self._index_names(connection)
+            self._unique_link_index = "uq_email_job_links_email_id_job_id" in index_names
+            
+            # Refresh planner statistics so the new indexes get used
+            if index_names != existing:
+                connection.execute(text("ANALYZE"))
+                logger.info("Created missing database indexes")
+
+    def _create_search_index(self) -> bool:
+        """Create the SQLite trigram search table and its sync triggers; False without FTS5"""
+        try:
+            with self.engine.begin() as connection:
+                created = not inspect(connection).has_table("job_applications_search")
+                for statement in _SEARCH_TABLE_DDL:
+                    connection.execute(text(statement))
+                if created:
+                    # Index the rows written before the table existed
+                    connection.execute(text(
+                        "INSERT INTO job_applications_search(job_applications_search) VALUES ('rebuild')"
+                    ))
+            return True
+        except OperationalError as e:
+            logger.warning(f"Trigram search unavailable, text filters will scan with LIKE: {e}")
+            return False
+
+    def _index_names(self, connection) -> set:
+        """Names of the indexes currently on the model tables"""
+        inspector = inspect(connection)
+        return {
+            index["name"]
+            for table_name in Base.metadata.tables
+            if inspector.has_table(table_name)
+            for index in inspector.get_indexes(table_name)
+        }
+
     def get_session(self) -> Session:
         """Get database session"""
         return self.SessionLocal()
 
-    async def add_application(self, application_data: Dict[str, Any]) -> int:
-        """Add new job application with enhanced extension support"""
+    def get_async_session(self) -> AsyncSession:
+        """Get async database session"""
+        return self.AsyncSessionLocal()
+
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provide an async session that commits on success and rolls back on error
+        
+        Pass it as ``session`` to the write methods that accept one, so several
+        writes of a request commit together in one transaction.
+        """
+        async with self.get_async_session() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        if session.info.pop("statistics_changed", False):
+            _invalidate_statistics_cache()
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Provide a session that commits on success and rolls back on error"""
         session = self.get_session()
         try:
-            # Determine source type
-            if application_data.get('status') == 'captured':
-                application_data['source_type'] = 'extension'
-            elif 'source_type' not in application_data:
-                application_data['source_type'] = 'email'
-
-            # Convert string date to datetime if needed
-            if isinstance(application_data.get('application_date'), str):
-                date_str = application_data['application_date']
-                try:
-                    # Try ISO format first
-                    if 'T' in date_str or 'Z' in date_str:
-                        application_data['application_date'] = datetime.fromisoformat(
-                            date_str.replace('Z', '+00:00')
-                        )
-                    else:
-                        # Try common date formats
-                        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']:
-                            try:
-                                application_data['application_date'] = datetime.strptime(date_str, fmt)
-                                break
-                            except ValueError:
-                                continue
-                        else:
-                            # If all formats fail, use current date
-                            logger.warning(f"Could not parse date '{date_str}', using current date")
-                            application_data['application_date'] = datetime.now()
-                except Exception as e:
-                    logger.warning(f"Date parsing failed for '{date_str}': {e}, using current date")
-                    application_data['application_date'] = datetime.now()
-            
-            # Ensure we have a valid date
-            if not application_data.get('application_date'):
-                application_data['application_date'] = datetime.now()
-            
-            # Handle captured_at field for extension jobs
-            if isinstance(application_data.get('captured_at'), str):
-                try:
-                    application_data['captured_at'] = datetime.fromisoformat(
-                        application_data['captured_at'].replace('Z', '+00:00')
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not parse captured_at: {e}")
-                    application_data['captured_at'] = datetime.now()
-            elif application_data.get('source_type') == 'extension' and not application_data.get('captured_at'):
-                application_data['captured_at'] = datetime.now()
-            
-            application = JobApplication(**application_data)
-            session.add(application)
+            yield session
             session.commit()
-            session.refresh(application)
-            logger.info(f"Added application: {application.company} - {application.position} (source: {application.source_type})")
-            return application.id
-        except SQLAlchemyError as e:
+        except Exception:
             session.rollback()
-            logger.error(f"Error adding application: {e}")
             raise
         finally:
             session.close()
 
+    def _prepare_application_data(self, application_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in source type and parse date fields of new application data in place"""
+        # Determine source type
+        if application_data.get('status') == 'captured':
+            application_data['source_type'] = 'extension'
+        elif 'source_type' not in application_data:
+            application_data['source_type'] = 'email'
+
+        # Convert string date to datetime if needed
+        if isinstance(application_data.get('application_date'), str):
+            date_str = application_data['application_date']
+            application_data['application_date'] = _parse_date(date_str)
+            if application_data['application_date'] is None:
+                logger.warning(f"Could not parse date '{date_str}', using current date")
+                application_data['application_date'] = datetime.now()
+        
+        # Ensure we have a valid date
+        if not application_data.get('application_date'):
+            application_data['application_date'] = datetime.now()
+        
+        # Handle captured_at field for extension jobs
+        if isinstance(application_data.get('captured_at'), str):
+            captured_str = application_data['captured_at']
+            application_data['captured_at'] = _parse_date(captured_str)
+            if application_data['captured_at'] is None:
+                logger.warning(f"Could not parse captured_at '{captured_str}', using current time")
+                application_data['captured_at'] = datetime.now()
+        elif application_data.get('source_type') == 'extension' and not application_data.get('captured_at'):
+            application_data['captured_at'] = datetime.now()
+        
+        return application_data
+
+    async def add_application(self, application_data: Dict[str, Any]) -> int:
+        """Add new job application with enhanced extension support"""
+        async with self.get_async_session() as session:
+            try:
+                # Core INSERT ... RETURNING; no mapped object or identity-map entry is needed for the ID
+                result = await session.execute(
+                    insert(JobApplication)
+                    .values(**self._prepare_application_data(application_data))
+                    .returning(JobApplication.id, JobApplication.company, JobApplication.position, JobApplication.source_type)
+                )
+                application = result.one()
+                await session.commit()
+                _invalidate_statistics_cache()
+                logger.info(f"Added application: {application.company} - {application.position} (source: {application.source_type})")
+                return application.id
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error adding application: {e}")
+                raise
+
+    async def add_applications_bulk(
+        self,
+        applications_data: List[Dict[str, Any]],
+        return_ids: bool = True
+    ) -> List[int]:
+        """
+        Add many job applications in one transaction
+        
+        Rows go through the same normalization as add_application and are written
+        with a single executemany INSERT, so bulk email ingest commits once.
+        
+        Args:
+            applications_data: Application dicts as accepted by add_application
+            return_ids: Set to False for backfills that do not need the new IDs;
+                the rows are then written as a plain bulk INSERT with no RETURNING
+        
+        Returns:
+            IDs of the new applications in the order given, or an empty list
+            when return_ids is False
+        """
+        if not applications_data:
+            return []
+        
+        rows = [self._prepare_application_data(data) for data in applications_data]
+        async with self.get_async_session() as session:
+            try:
+                application_ids = []
+                if return_ids:
+                    result = await session.execute(
+                        insert(JobApplication).returning(JobApplication.id, sort_by_parameter_order=True),
+                        rows
+                    )
+                    application_ids = list(result.scalars())
+                else:
+                    await session.execute(insert(JobApplication), rows)
+                await session.commit()
+                _invalidate_statistics_cache()
+                logger.info(f"Added {len(rows)} applications in bulk")
+                return application_ids
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error adding applications in bulk: {e}")
+                raise
+
     def search_applications_by_company_and_position(self, company: str, position: str = None, 
                                                   days_back: int = 45) -> List[Dict[str, Any]]:
         """
@@ -118,11 +616,11 @@ class DatabaseManager:
             
             # Add company filter (case-insensitive)
             if company:
-                query = query.filter(JobApplication.company.ilike(f'%{company}%'))
+                query = query.filter(_icontains(JobApplication.company, _contains_pattern(company)))
             
             # Add position filter if provided
             if position:
-                query = query.filter(JobApplication.position.ilike(f'%{position}%'))
+                query = query.filter(_icontains(JobApplication.position, _contains_pattern(position)))
             
             applications = query.order_by(JobApplication.application_date.desc()).all()
             
@@ -142,41 +640,23 @@ class DatabaseManager:
         company: Optional[str] = None,
         search: Optional[str] = None,
         source_type: Optional[str] = None,
-        job_board: Optional[str] = None
-    ) -> List[JobApplication]:
-        """Get job applications with enhanced filtering for extension jobs"""
+        job_board: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        """
+        Get job applications with enhanced filtering for extension jobs
+        
+        Returns plain rows of the application columns rather than ORM objects;
+        serialize them with JobApplication.row_to_dict.
+        
+        Pass ``after`` as the ``(created_at, id)`` of the last application from the
+        previous page to seek straight to the next page instead of using ``skip``.
+        """
         session = self.get_session()
         try:
-            query = session.query(JobApplication)
-            
-            # Apply filters
-            if status:
-                query = query.filter(JobApplication.status == status)
-            
-            if company:
-                query = query.filter(JobApplication.company.ilike(f"%{company}%"))
-            
-            if source_type:
-                query = query.filter(JobApplication.source_type == source_type)
-            
-            if job_board:
-                query = query.filter(JobApplication.job_board == job_board)
-            
-            if search:
-                query = query.filter(
-                    or_(
-                        JobApplication.company.ilike(f"%{search}%"),
-                        JobApplication.position.ilike(f"%{search}%"),
-                        JobApplication.location.ilike(f"%{search}%")
-                    )
-                )
-            
-            # Order by creation date (newest first)
-            query = query.order_by(JobApplication.created_at.desc())
-            
-            # Apply pagination
-            applications = query.offset(skip).limit(limit).all()
-            return applications
+            return self._get_applications(
+                session, skip, limit, status, company, search, source_type, job_board, after
+            )
             
         except SQLAlchemyError as e:
             logger.error(f"Error getting applications: {e}")
@@ -184,6 +664,164 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def _get_applications(
+        self,
+        session: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        search: Optional[str] = None,
+        source_type: Optional[str] = None,
+        job_board: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        """Run get_applications on the given session, leaving it open"""
+        return session.execute(self._applications_statement(
+            skip, limit, status, company, search, source_type, job_board, after
+        )).all()
+
+    async def get_applications_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        search: Optional[str] = None,
+        source_type: Optional[str] = None,
+        job_board: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        summary: bool = False
+    ) -> Tuple[List[Row], int]:
+        """
+        Get a page of applications together with the total matching the filters
+        
+        Offset pages read the total from a COUNT(*) OVER () window on the page
+        query itself, so both come back in one statement. Rows then carry an
+        extra ``total`` column, which row_to_dict ignores. Keyset pages (and
+        pages past the end) still need a separate count, because the seek
+        condition would otherwise be counted as a filter.
+        
+        Set ``summary`` for list views that do not show job descriptions, notes
+        or extraction data; those columns then come back as None.
+        """
+        async with self.get_async_session() as session:
+            try:
+                result = await session.execute(self._applications_statement(
+                    skip, limit, status, company, search, source_type, job_board,
+                    after, with_total=after is None, summary=summary
+                ))
+                applications = result.all()
+                if applications and after is None:
+                    return applications, applications[0].total
+                
+                result = await session.execute(self._applications_count_statement(
+                    status, company, search, source_type, job_board
+                ))
+                return applications, result.scalar_one()
+                
+            except SQLAlchemyError as e:
+                logger.error(f"Error getting applications: {e}")
+                return [], 0
+
+    def iter_applications(
+        self,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        search: Optional[str] = None,
+        source_type: Optional[str] = None,
+        job_board: Optional[str] = None,
+        summary: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every application matching the filters as row_to_dict dicts
+        
+        Rows are streamed in batches of 1000, so exports of any size run in
+        bounded memory; ordering and ``summary`` are as in get_applications_page.
+        Database errors are logged and re-raised, so a stream cut short by one
+        never looks like a complete export.
+        """
+        with self.session_scope() as session:
+            try:
+                stmt = self._applications_statement(
+                    0, None, status, company, search, source_type, job_board, summary=summary
+                )
+                result = session.execute(stmt, execution_options={"yield_per": 1000})
+                for row in result:
+                    yield JobApplication.row_to_dict(row)
+            except SQLAlchemyError as e:
+                logger.error(f"Error iterating applications: {e}")
+                raise
+
+    def _applications_count_statement(
+        self,
+        status: Optional[str],
+        company: Optional[str],
+        search: Optional[str],
+        source_type: Optional[str],
+        job_board: Optional[str]
+    ):
+        """Build the COUNT(*) statement behind get_applications_count"""
+        stmt = lambda_stmt(lambda: select(func.count()).select_from(JobApplication))
+        return _filter_applications(
+            stmt, status, company, search, source_type, job_board, self._search_index
+        )
+
+    def _applications_statement(
+        self,
+        skip: int,
+        limit: Optional[int],
+        status: Optional[str],
+        company: Optional[str],
+        search: Optional[str],
+        source_type: Optional[str],
+        job_board: Optional[str],
+        after: Optional[Tuple[datetime, int]] = None,
+        with_total: bool = False,
+        summary: bool = False
+    ):
+        """Build the filtered, ordered and paginated statement behind get_applications"""
+        if summary:
+            stmt = lambda_stmt(lambda: select(*_APPLICATION_LISTING_COLUMNS))
+        else:
+            stmt = lambda_stmt(lambda: select(*_APPLICATION_COLUMNS))
+        
+        if with_total:
+            # Window functions run before OFFSET/LIMIT, so this is the filtered total
+            stmt += lambda s: s.add_columns(func.count().over().label("total"))
+        
+        stmt = _filter_applications(
+            stmt, status, company, search, source_type, job_board, self._search_index
+        )
+        
+        # Order by creation date (newest first), id breaks ties so the keyset is unique
+        stmt += lambda s: s.order_by(JobApplication.created_at.desc(), JobApplication.id.desc())
+        
+        # Apply pagination
+        if after:
+            # Compare against the stored created_at of the cursor row: SQLite keeps
+            # server-default timestamps as text without microseconds, so a bound
+            # datetime never compares equal to it
+            after_created_at, after_id = after
+            stmt += lambda s: s.where(
+                tuple_(JobApplication.created_at, JobApplication.id) < tuple_(
+                    func.coalesce(
+                        select(JobApplication.created_at).where(
+                            JobApplication.id == after_id
+                        ).scalar_subquery(),
+                        after_created_at
+                    ),
+                    after_id
+                )
+            )
+        elif skip:
+            stmt += lambda s: s.offset(skip)
+        
+        if limit is not None:
+            stmt += lambda s: s.limit(limit)
+        
+        return stmt
+
     def get_applications_count(
         self,
         status: Optional[str] = None,
@@ -195,33 +833,9 @@ class DatabaseManager:
         """Get total count of job applications with the same filters as get_applications"""
         session = self.get_session()
         try:
-            query = session.query(JobApplication)
-            
-            # Apply the same filters as get_applications
-            if status:
-                query = query.filter(JobApplication.status == status)
-            
-            if company:
-                query = query.filter(JobApplication.company.ilike(f"%{company}%"))
-            
-            if source_type:
-                query = query.filter(JobApplication.source_type == source_type)
-            
-            if job_board:
-                query = query.filter(JobApplication.job_board == job_board)
-            
-            if search:
-                query = query.filter(
-                    or_(
-                        JobApplication.company.ilike(f"%{search}%"),
-                        JobApplication.position.ilike(f"%{search}%"),
-                        JobApplication.location.ilike(f"%{search}%")
-                    )
-                )
-            
-            # Get count
-            count = query.count()
-            return count
+            return session.execute(self._applications_count_statement(
+                status, company, search, source_type, job_board
+            )).scalar_one()
             
         except SQLAlchemyError as e:
             logger.error(f"Error counting applications: {e}")
@@ -229,12 +843,42 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def get_extension_jobs(self, limit: int = 100) -> List[JobApplication]:
-        """Get jobs captured via browser extension"""
+    def get_application_summaries(self, limit: int = 1000) -> List[Row]:
+        """
+        Get the newest applications with only their identifying columns
+        
+        Duplicate checks scan many rows but only compare URLs, companies and
+        positions, so the large text columns are never fetched.
+        """
+        session = self.get_session()
+        try:
+            return session.execute(
+                select(*_APPLICATION_SUMMARY_COLUMNS).order_by(
+                    JobApplication.created_at.desc(), JobApplication.id.desc()
+                ).limit(limit)
+            ).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting application summaries: {e}")
+            return []
+        finally:
+            session.close()
+
+    def get_extension_jobs(self, limit: int = 100, session: Optional[Session] = None) -> List[Row]:
+        """
+        Get jobs captured via browser extension
+        
+        Pass ``session`` to run on a session the caller already holds, so a
+        request that reads several things in a row uses one connection; errors
+        then propagate to the caller instead of being logged here.
+        """
+        if session is not None:
+            return self._get_applications(session, source_type="extension", limit=limit)
         return self.get_applications(source_type="extension", limit=limit)
 
-    def get_email_jobs(self, limit: int = 100) -> List[JobApplication]:
-        """Get jobs captured via email monitoring"""  
+    def get_email_jobs(self, limit: int = 100, session: Optional[Session] = None) -> List[Row]:
+        """Get jobs captured via email monitoring; ``session`` as in get_extension_jobs"""
+        if session is not None:
+            return self._get_applications(session, source_type="email", limit=limit)
         return self.get_applications(source_type="email", limit=limit)
 
     async def get_applications_since(self, cutoff_date: datetime) -> List[JobApplication]:
@@ -247,28 +891,27 @@ class DatabaseManager:
         Returns:
             List of JobApplication objects
         """
-        session = self.get_session()
-        try:
-            applications = session.query(JobApplication).filter(
-                JobApplication.application_date >= cutoff_date
-            ).order_by(JobApplication.application_date.desc()).all()
-            
-            logger.debug(f"Found {len(applications)} applications since {cutoff_date}")
-            return applications
-            
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting applications since {cutoff_date}: {e}")
-            return []
-        finally:
-            session.close()
+        async with self.get_async_session() as session:
+            try:
+                result = await session.execute(
+                    select(JobApplication).where(
+                        JobApplication.application_date >= cutoff_date
+                    ).order_by(JobApplication.application_date.desc())
+                )
+                applications = result.scalars().all()
+                
+                logger.debug(f"Found {len(applications)} applications since {cutoff_date}")
+                return applications
+                
+            except SQLAlchemyError as e:
+                logger.error(f"Error getting applications since {cutoff_date}: {e}")
+                return []
 
     def get_application(self, application_id: int) -> Optional[JobApplication]:
         """Get single application by ID"""
         session = self.get_session()
         try:
-            application = session.query(JobApplication).filter(
-                JobApplication.id == application_id
-            ).first()
+            application = session.get(JobApplication, application_id)
             return application
         except SQLAlchemyError as e:
             logger.error(f"Error getting application {application_id}: {e}")
@@ -276,7 +919,7 @@ class DatabaseManager:
         finally:
             session.close()
     
-    def get_application_by_id(self, application_id: int) -> Optional[Dict[str, Any]]:
+    async def get_application_by_id(self, application_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a single job application by ID
         
@@ -286,54 +929,90 @@ class DatabaseManager:
         Returns:
             Application dict or None if not found
         """
+        async with self.get_async_session() as session:
+            try:
+                # A fresh session's identity map is empty, so get() would always
+                # query anyway; selecting columns also skips building the entity
+                result = await session.execute(
+                    select(*_APPLICATION_COLUMNS).where(JobApplication.id == application_id)
+                )
+                row = result.one_or_none()
+                
+                return JobApplication.row_to_dict(row) if row else None
+                
+            except SQLAlchemyError as e:
+                logger.error(f"Error getting application {application_id}: {e}")
+                return None
+
+    def get_applications_by_ids(self, application_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get several job applications by ID with one primary-key IN query
+        
+        Args:
+            application_ids: IDs of the applications
+            
+        Returns:
+            Application dicts keyed by ID; IDs that do not exist are left out
+        """
+        if not application_ids:
+            return {}
+        
         session = self.get_session()
         try:
-            application = session.query(JobApplication).filter(
-                JobApplication.id == application_id
-            ).first()
+            rows = session.execute(
+                select(*_APPLICATION_COLUMNS).where(JobApplication.id.in_(application_ids))
+            ).all()
             
-            return application.to_dict() if application else None
+            return {row.id: JobApplication.row_to_dict(row) for row in rows}
             
         except SQLAlchemyError as e:
-            logger.error(f"Error getting application {application_id}: {e}")
-            return None
+            logger.error(f"Error getting applications {application_ids}: {e}")
+            return {}
         finally:
             session.close()
 
-    async def update_application_notes(self, application_id: int, notes: str) -> bool:
+    async def update_application_notes(
+        self, application_id: int, notes: str, session: Optional[AsyncSession] = None
+    ) -> bool:
         """
         Update the notes field for a job application
         
         Args:
             application_id: ID of the application to update
             notes: New notes content
+            session: Session from async_session_scope to write in the caller's
+                transaction; errors then propagate instead of being logged here
             
         Returns:
             True if successful, False otherwise
         """
-        session = self.get_session()
-        try:
-            application = session.query(JobApplication).filter(
-                JobApplication.id == application_id
-            ).first()
-            
-            if application:
-                application.notes = notes
-                application.updated_at = datetime.now()
-                session.commit()
-                
-                logger.info(f"📝 Updated notes for application {application_id}")
-                return True
-            else:
-                logger.warning(f"⚠️ Application {application_id} not found for notes update")
+        if session is not None:
+            return await self._update_application_notes(session, application_id, notes)
+        
+        async with self.get_async_session() as session:
+            try:
+                updated = await self._update_application_notes(session, application_id, notes)
+                await session.commit()
+                return updated
+                    
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error updating application notes: {e}")
                 return False
-                
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error updating application notes: {e}")
-            return False
-        finally:
-            session.close()
+
+    async def _update_application_notes(self, session: AsyncSession, application_id: int, notes: str) -> bool:
+        """Set an application's notes on the given session without committing"""
+        result = await session.execute(
+            update(JobApplication)
+            .where(JobApplication.id == application_id)
+            .values(notes=notes, updated_at=func.now())
+        )
+        
+        if result.rowcount > 0:
+            logger.info(f"📝 Updated notes for application {application_id}")
+            return True
+        logger.warning(f"⚠️ Application {application_id} not found for notes update")
+        return False
 
     async def update_application_status(self, application_id: int, new_status: str) -> Optional[Dict[str, Any]]:
         """
@@ -346,283 +1025,334 @@ class DatabaseManager:
         Returns:
             Updated application dict or None if not found
         """
-        session = self.get_session()
-        try:
-            application = session.query(JobApplication).filter(
-                JobApplication.id == application_id
-            ).first()
-            
-            if application:
-                old_status = application.status
-                application.status = new_status
-                application.updated_at = datetime.now()
-                
-                # Update status-specific dates
-                if new_status == 'interview' and not application.interview_date:
-                    application.interview_date = datetime.now()
-                elif new_status in ['offer', 'accepted']:
-                    application.offer_date = datetime.now()
-                elif new_status == 'rejected':
-                    application.rejection_date = datetime.now()
-                
-                session.commit()
+        async with self.get_async_session() as session:
+            try:
+                # One UPDATE ... RETURNING plain columns instead of loading the row first
+                result = await session.execute(
+                    update(JobApplication)
+                    .where(JobApplication.id == application_id)
+                    .values(status=new_status)
+                    .returning(*_APPLICATION_COLUMNS)
+                )
+                row = result.one_or_none()
                 
-                logger.info(f"📝 Updated application {application_id}: {old_status} -> {new_status}")
-                return application.to_dict()
-            else:
-                logger.warning(f"⚠️ Application {application_id} not found")
+                if row:
+                    application_data = JobApplication.row_to_dict(row)
+                    await session.commit()
+                    _invalidate_statistics_cache()
+                    
+                    logger.info(f"📝 Updated application {application_id} status -> {new_status}")
+                    return application_data
+                else:
+                    logger.warning(f"⚠️ Application {application_id} not found")
+                    return None
+                    
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error updating application status: {e}")
                 return None
-                
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error updating application status: {e}")
-            return None
-        finally:
-            session.close()
 
     async def update_application(self, application_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update application with provided data and return updated application data"""
-        session = self.get_session()
-        try:
-            application = session.query(JobApplication).filter(
-                JobApplication.id == application_id
-            ).first()
-
-            if not application:
-                return None
-
-            # List of updatable fields
-            updatable_fields = [
-                'company', 'position', 'application_date', 'status',
-                'job_url', 'job_description', 'salary_range', 'location', 'notes'
-            ]
-
-            # Update only provided fields
-            for field, value in update_data.items():
-                if field in updatable_fields and hasattr(application, field):
-                    # Special handling for date fields
-                    if field == 'application_date' and isinstance(value, str):
-                        try:
-                            # Parse date string to datetime object
-                            from datetime import datetime as dt
-                            parsed_date = dt.strptime(value, '%Y-%m-%d').date()
-                            setattr(application, field, parsed_date)
-                        except ValueError:
-                            logger.error(f"Invalid date format for {field}: {value}")
-                            continue
-                    else:
-                        setattr(application, field, value)
+        async with self.get_async_session() as session:
+            try:
+                # List of updatable fields
+                updatable_fields = [
+                    'company', 'position', 'application_date', 'status',
+                    'job_url', 'job_description', 'salary_range', 'location', 'notes'
+                ]
+
+                # Update only provided fields
+                values = {}
+                for field, value in update_data.items():
+                    if field in updatable_fields:
+                        # Special handling for date fields
+                        if field == 'application_date' and isinstance(value, str):
+                            parsed_date = _parse_date(value)
+                            if parsed_date is None:
+                                logger.error(f"Invalid date format for {field}: {value}")
+                                continue
+                            value = parsed_date
+                        values[field] = value
+                values['updated_at'] = func.now()
+
+                # One UPDATE ... RETURNING plain columns instead of loading the row first
+                result = await session.execute(
+                    update(JobApplication)
+                    .where(JobApplication.id == application_id)
+                    .values(**values)
+                    .returning(*_APPLICATION_COLUMNS)
+                )
+                row = result.one_or_none()
 
-            application.updated_at = datetime.now()
-            session.commit()
-            session.refresh(application)
-            logger.info(f"Updated application {application_id}")
+                if not row:
+                    return None
 
-            # Return the updated application data
-            return application.to_dict()
+                application_data = JobApplication.row_to_dict(row)
+                await session.commit()
+                _invalidate_statistics_cache()
+                logger.info(f"Updated application {application_id}")
 
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error updating application: {e}")
-            return None
-        finally:
-            session.close()
+                # Return the updated application data
+                return application_data
 
-    async def get_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive application statistics"""
-        session = self.get_session()
-        try:
-            now = datetime.now()
-            today_date = now.date()
-            this_week_start = today_date - timedelta(days=today_date.weekday())
-            this_month_start = today_date.replace(day=1)
-            
-            # Get total applications
-            total = session.query(JobApplication).count()
-            
-            # Get today's applications (using date range for better reliability)
-            # Use application_date since it's explicitly set to datetime.now() in capture endpoint
-            # This avoids timezone issues with created_at which is set by database server
-            today_start = datetime.combine(today_date, datetime.min.time())
-            tomorrow_start = datetime.combine(today_date + timedelta(days=1), datetime.min.time())
-            
-            # Debug: Check what dates we're comparing
-            logger.info(f"📊 Statistics query - today_date: {today_date}, today_start: {today_start}, tomorrow_start: {tomorrow_start}")
-            
-            # Get all applications to debug
-            all_apps = session.query(JobApplication).all()
-            logger.info(f"📊 Total applications in DB: {len(all_apps)}")
-            
-            # Check application_date values
-            for app in all_apps[-5:]:  # Last 5 apps
-                if app.application_date:
-                    logger.info(f"📊 App {app.id}: application_date={app.application_date}, date={app.application_date.date()}, in_range={today_start <= app.application_date < tomorrow_start}")
-            
-            today_count = session.query(JobApplication).filter(
-                JobApplication.application_date >= today_start,
-                JobApplication.application_date < tomorrow_start
-            ).count()
-            
-            logger.info(f"📊 Today's count result: {today_count} (date range: {today_start} to {tomorrow_start})")
-            
-            # Get this week's applications
-            this_week = session.query(JobApplication).filter(
-                JobApplication.created_at >= this_week_start
-            ).count()
-            
-            # Get this month's applications
-            this_month = session.query(JobApplication).filter(
-                JobApplication.created_at >= this_month_start
-            ).count()
-            
-            # Get status distribution
-            status_counts = {}
-            for status in ["applied", "interview", "offer", "rejected", "assessment", "screening", "captured"]:
-                count = session.query(JobApplication).filter(
-                    JobApplication.status == status
-                ).count()
-                status_counts[status] = count
-
-            # Calculate rates
-            interview_rate = (status_counts.get("interview", 0) / total * 100) if total > 0 else 0
-            response_rate = ((status_counts.get("interview", 0) + status_counts.get("rejected", 0)) / total * 100) if total > 0 else 0
-
-            # Calculate average per day (last 30 days)
-            thirty_days_ago = now - timedelta(days=30)
-            recent_applications = session.query(JobApplication).filter(
-                JobApplication.created_at >= thirty_days_ago
-            ).count()
-            avg_per_day = recent_applications / 30 if recent_applications > 0 else 0
-
-            # Get top companies
-            top_companies_query = session.query(
-                JobApplication.company,
-                func.count(JobApplication.id).label('count')
-            ).group_by(JobApplication.company).order_by(func.count(JobApplication.id).desc()).limit(5)
-            
-            top_companies = []
-            for company, count in top_companies_query:
-                top_companies.append({"company": company, "count": count})
-
-            # Create status distribution (same as byStatus but with different key names)
-            status_distribution = {status: count for status, count in status_counts.items()}
-
-            return {
-                "total": total,
-                "today": today_count,
-                "thisWeek": this_week,
-                "thisMonth": this_month,
-                "avgPerDay": round(avg_per_day, 1),
-                "topCompanies": top_companies,
-                "statusDistribution": status_distribution,
-                "byStatus": status_counts,
-                "interviewRate": round(interview_rate, 1),
-                "responseRate": round(response_rate, 1)
-            }
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error updating application: {e}")
+                return None
 
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting statistics: {e}")
-            return {
-                "total": 0,
-                "today": 0,
-                "thisWeek": 0,
-                "thisMonth": 0,
-                "avgPerDay": 0,
-                "topCompanies": [],
-                "statusDistribution": {},
-                "byStatus": {},
-                "interviewRate": 0,
-                "responseRate": 0
-            }
-        finally:
-            session.close()
+    def _remember_processed(self, email_ids):
+        """Add or refresh email IDs in the in-memory processed cache, evicting the oldest"""
+        cache = self._processed_email_ids
+        for email_id in email_ids:
+            if email_id in cache:
+                cache.move_to_end(email_id)
+            else:
+                cache[email_id] = None
+        while len(cache) > PROCESSED_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+    def _recent_processed_ids(self):
+        """Statement for the newest processed email IDs to seed the cache with, newest first"""
+        return select(EmailProcessingLog.email_id).order_by(
+            EmailProcessingLog.id.desc()
+        ).limit(PROCESSED_CACHE_SEED_SIZE)
+
+    def _seed_processed_cache(self, newest_first: List[str]):
+        """Seed the cache so the most recently processed IDs are evicted last"""
+        self._remember_processed(reversed(newest_first))
+        self._processed_cache_loaded = True
+
+    async def _load_processed_cache(self):
+        """
+        Seed the processed cache from the log once per process
+        
+        Polling re-checks mostly emails that were handled before a restart, so
+        one bulk read replaces a query per already-processed email. IDs that
+        are not cached are still checked against the database.
+        """
+        async with self.get_async_session() as session:
+            try:
+                result = await session.execute(self._recent_processed_ids())
+                self._seed_processed_cache(result.scalars().all())
+            except SQLAlchemyError as e:
+                logger.error(f"Error loading processed email IDs: {e}")
+                self._processed_cache_loaded = True
 
     async def is_email_processed(self, email_id: str) -> bool:
         """Check if email has been processed"""
+        if not self._processed_cache_loaded:
+            await self._load_processed_cache()
+        if email_id in self._processed_email_ids:
+            self._processed_email_ids.move_to_end(email_id)
+            return True
+        
+        async with self.get_async_session() as session:
+            try:
+                result = await session.execute(
+                    select(exists().where(EmailProcessingLog.email_id == email_id))
+                )
+                processed = result.scalar()
+                if processed:
+                    self._remember_processed((email_id,))
+                return processed
+            except SQLAlchemyError as e:
+                logger.error(f"Error checking email processing status: {e}")
+                return False
+
+    def filter_processed(self, email_ids: List[str]) -> set:
+        """
+        Return the subset of email IDs that have already been processed
+        
+        Prefer this over calling is_email_processed per email: it checks a whole
+        batch with one IN query per chunk instead of one query per email.
+        """
         session = self.get_session()
         try:
-            log = session.query(EmailProcessingLog).filter(
-                EmailProcessingLog.email_id == email_id
-            ).first()
-            return log is not None
+            if not self._processed_cache_loaded:
+                self._seed_processed_cache(session.execute(self._recent_processed_ids()).scalars().all())
+            
+            processed = {email_id for email_id in email_ids if email_id in self._processed_email_ids}
+            self._remember_processed(processed)
+            unknown_ids = [email_id for email_id in email_ids if email_id not in processed]
+            
+            # Chunk the IN list to stay under SQLite's bound parameter limit
+            for start in range(0, len(unknown_ids), PROCESSED_LOOKUP_CHUNK_SIZE):
+                chunk = unknown_ids[start:start + PROCESSED_LOOKUP_CHUNK_SIZE]
+                rows = session.query(EmailProcessingLog.email_id).filter(
+                    EmailProcessingLog.email_id.in_(chunk)
+                ).all()
+                found = [row[0] for row in rows]
+                processed.update(found)
+                self._remember_processed(found)
+            return processed
         except SQLAlchemyError as e:
             logger.error(f"Error checking email processing status: {e}")
-            return False
+            return set()
         finally:
             session.close()
 
     async def mark_email_processed(self, email_id: str):
         """Mark email as processed"""
-        session = self.get_session()
-        try:
-            # Check if already logged
-            existing_log = session.query(EmailProcessingLog).filter(
-                EmailProcessingLog.email_id == email_id
-            ).first()
-            
-            if not existing_log:
-                log = EmailProcessingLog(
-                    email_id=email_id,
-                    is_job_related=True,  # Assume it was processed for job-related content
-                    confidence_score=1.0
+        await self.mark_emails_processed([email_id])
+
+    async def mark_emails_processed(self, email_ids: List[str]):
+        """
+        Mark many emails as processed in a single transaction
+        
+        One commit for the whole batch instead of one per email; IDs that are
+        already logged are skipped.
+        """
+        email_ids = list(dict.fromkeys(email_ids))
+        if not email_ids:
+            return
+        
+        async with self.get_async_session() as session:
+            try:
+                # Insert unless already logged; email_id is unique, so concurrent
+                # fetchers cannot race each other into a duplicate
+                inserted = await self._insert_ignoring_conflicts(
+                    session,
+                    EmailProcessingLog,
+                    [
+                        {
+                            "email_id": email_id,
+                            "is_job_related": True,  # Assume it was processed for job-related content
+                            "confidence_score": 1.0
+                        }
+                        for email_id in email_ids
+                    ],
+                    conflict_columns=["email_id"]
                 )
-                session.add(log)
-                session.commit()
-                logger.info(f"Marked email {email_id} as processed")
-            else:
-                logger.debug(f"Email {email_id} already marked as processed")
+                await session.commit()
+                self._remember_processed(email_ids)
                 
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error marking email as processed: {e}")
-        finally:
-            session.close()
+                if inserted:
+                    logger.info(f"Marked {inserted} email(s) as processed")
+                if inserted < len(email_ids):
+                    logger.debug(f"{len(email_ids) - inserted} email(s) already marked as processed")
+                    
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error marking email as processed: {e}")
+
+    async def _insert_ignoring_conflicts(
+        self,
+        session: AsyncSession,
+        model,
+        rows: List[Dict[str, Any]],
+        conflict_columns: List[str]
+    ) -> int:
+        """
+        INSERT rows, skipping those that collide with a unique constraint on conflict_columns
+        
+        Uses one executemany with ON CONFLICT DO NOTHING on SQLite and
+        PostgreSQL; other dialects fall back to a savepoint per row that
+        swallows the IntegrityError.
+        
+        Returns:
+            Number of rows inserted
+        """
+        dialect_insert = _CONFLICT_INSERTS.get(self.engine.dialect.name)
+        if dialect_insert is not None:
+            # Against the table, so this is a Core executemany that reports its rowcount
+            stmt = dialect_insert(model.__table__).on_conflict_do_nothing(index_elements=conflict_columns)
+            result = await session.execute(stmt, rows)
+            return result.rowcount
+        
+        inserted = 0
+        for row in rows:
+            try:
+                async with session.begin_nested():
+                    await session.execute(insert(model).values(**row))
+                inserted += 1
+            except IntegrityError:
+                pass
+        return inserted
 
     def log_email_processing(self, email_id: str, is_job_related: bool, confidence_score: float = 0.0):
         """Log email processing result"""
-        session = self.get_session()
+        self.log_email_processing_bulk([{
+            "email_id": email_id,
+            "is_job_related": is_job_related,
+            "confidence_score": confidence_score
+        }])
+
+    def log_email_processing_bulk(self, records: List[Dict[str, Any]]):
+        """
+        Log processing results for many emails in a single transaction
+        
+        Args:
+            records: Dicts with ``email_id``, ``is_job_related`` and optional ``confidence_score``
+        """
+        if not records:
+            return
+        
+        rows = [
+            {
+                "email_id": record["email_id"],
+                "is_job_related": record["is_job_related"],
+                "confidence_score": record.get("confidence_score", 0.0)
+            }
+            for record in records
+        ]
+        
+        # One executemany; on SQLite and PostgreSQL an email that is already
+        # logged is skipped instead of failing the whole batch
+        dialect_insert = _CONFLICT_INSERTS.get(self.engine.dialect.name)
+        if dialect_insert is not None:
+            stmt = dialect_insert(EmailProcessingLog).on_conflict_do_nothing(index_elements=["email_id"])
+        else:
+            stmt = insert(EmailProcessingLog)
+        
         try:
-            log = EmailProcessingLog(
-                email_id=email_id,
-                is_job_related=is_job_related,
-                confidence_score=confidence_score
-            )
-            session.add(log)
-            session.commit()
+            with self.session_scope() as session:
+                session.execute(stmt, rows)
+            self._remember_processed(row["email_id"] for row in rows)
         except SQLAlchemyError as e:
-            session.rollback()
             logger.error(f"Error logging email processing: {e}")
-        finally:
-            session.close()
 
-    async def delete_application(self, application_id: int) -> bool:
-        """Delete job application"""
-        session = self.get_session()
-        try:
-            application = session.query(JobApplication).filter(
-                JobApplication.id == application_id
-            ).first()
-            
-            if application:
-                session.delete(application)
-                session.commit()
-                logger.info(f"Deleted application {application_id}")
-                return True
-            return False
-            
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error deleting application: {e}")
-            return False
-        finally:
-            session.close()
+    async def delete_application(self, application_id: int, session: Optional[AsyncSession] = None) -> bool:
+        """Delete job application; ``session`` as in update_application_notes"""
+        if session is not None:
+            return await self._delete_application(session, application_id)
+        
+        async with self.get_async_session() as session:
+            try:
+                deleted = await self._delete_application(session, application_id)
+                await session.commit()
+                
+                if deleted:
+                    _invalidate_statistics_cache()
+                return deleted
+                
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error deleting application: {e}")
+                return False
+
+    async def _delete_application(self, session: AsyncSession, application_id: int) -> bool:
+        """Delete an application on the given session without committing"""
+        # Plain DELETE: the row is never loaded, and links are handled explicitly
+        # (see _reassign_email_job_links)
+        result = await session.execute(
+            delete(JobApplication).where(JobApplication.id == application_id)
+        )
+        
+        if result.rowcount > 0:
+            session.info["statistics_changed"] = True
+            logger.info(f"Deleted application {application_id}")
+            return True
+        return False
 
     async def close(self):
         """Close database connections"""
         try:
             if hasattr(self, 'engine'):
                 self.engine.dispose()
-                logger.info("Database connections closed successfully")
+            if hasattr(self, 'async_engine'):
+                await self.async_engine.dispose()
+            logger.info("Database connections closed successfully")
         except Exception as e:
             logger.error(f"Error closing database connections: {e}")
 
@@ -637,56 +1367,75 @@ class DatabaseManager:
         Returns:
             Link ID if successful, None otherwise
         """
-        session = self.get_session()
-        try:
-            # Check if link already exists
-            existing_link = session.query(EmailJobLink).filter(
-                EmailJobLink.email_id == link_data['email_id'],
-                EmailJobLink.job_id == link_data['job_id']
-            ).first()
-            
-            if existing_link:
-                logger.debug(f"Link already exists: Email {link_data['email_id']} -> Job {link_data['job_id']}")
-                return existing_link.id
-            
-            # Create new link
-            link = EmailJobLink(
-                email_id=link_data['email_id'],
-                job_id=link_data['job_id'],
-                confidence_score=link_data.get('confidence_score', 0.0),
-                match_methods=link_data.get('match_methods', '[]'),
-                match_details=link_data.get('match_details', '{}'),
-                match_explanation=link_data.get('match_explanation', ''),
-                link_type=link_data.get('link_type', 'automatic'),
-                created_by=link_data.get('created_by', 'system'),
-                is_verified=link_data.get('is_verified', False),
-                is_rejected=link_data.get('is_rejected', False)
-            )
-            
-            session.add(link)
-            session.commit()
-            
-            logger.info(f"🔗 Created email-job link: Email {link_data['email_id']} -> Job {link_data['job_id']}")
-            return link.id
-            
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error creating email-job link: {e}")
-            return None
-        finally:
-            session.close()
+        async with self.get_async_session() as session:
+            try:
+                values = dict(
+                    email_id=link_data['email_id'],
+                    job_id=link_data['job_id'],
+                    confidence_score=link_data.get('confidence_score', 0.0),
+                    match_methods=link_data.get('match_methods', '[]'),
+                    match_details=link_data.get('match_details', '{}'),
+                    match_explanation=link_data.get('match_explanation', ''),
+                    link_type=link_data.get('link_type', 'automatic'),
+                    created_by=link_data.get('created_by', 'system'),
+                    is_verified=link_data.get('is_verified', False),
+                    is_rejected=link_data.get('is_rejected', False)
+                )
+                
+                # New links are written in one round trip; the existing ID is
+                # only looked up when the unique (email_id, job_id) index refused the row
+                dialect_insert = _CONFLICT_INSERTS.get(self.engine.dialect.name)
+                link_id = None
+                if dialect_insert is not None and self._unique_link_index:
+                    result = await session.execute(
+                        dialect_insert(EmailJobLink).values(**values).on_conflict_do_nothing(
+                            index_elements=['email_id', 'job_id']
+                        ).returning(EmailJobLink.id)
+                    )
+                    link_id = result.scalar()
+                
+                if link_id is None:
+                    result = await session.execute(
+                        select(EmailJobLink.id).where(
+                            EmailJobLink.email_id == link_data['email_id'],
+                            EmailJobLink.job_id == link_data['job_id']
+                        ).limit(1)
+                    )
+                    existing_link_id = result.scalar()
+                    
+                    if existing_link_id is not None:
+                        logger.debug(f"Link already exists: Email {link_data['email_id']} -> Job {link_data['job_id']}")
+                        return existing_link_id
+                    
+                    link = EmailJobLink(**values)
+                    session.add(link)
+                    await session.flush()
+                    link_id = link.id
+                
+                await session.commit()
+                _invalidate_statistics_cache()
+                
+                logger.info(f"🔗 Created email-job link: Email {link_data['email_id']} -> Job {link_data['job_id']}")
+                return link_id
+                
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error creating email-job link: {e}")
+                return None
 
     def get_email_job_link(self, email_id: str, job_id: int) -> Optional[EmailJobLink]:
         """Get specific email-job link"""
         session = self.get_session()
         try:
-            link = session.query(EmailJobLink).filter(
-                and_(
-                    EmailJobLink.email_id == email_id,
-                    EmailJobLink.job_id == job_id,
-                    EmailJobLink.is_rejected == False
-                )
-            ).first()
+            link = session.execute(
+                select(EmailJobLink).where(
+                    and_(
+                        EmailJobLink.email_id == email_id,
+                        EmailJobLink.job_id == job_id,
+                        EmailJobLink.is_rejected == False
+                    )
+                ).limit(1)
+            ).scalars().first()
             return link
         except SQLAlchemyError as e:
             logger.error(f"Error getting email-job link: {e}")
@@ -698,8 +1447,10 @@ class DatabaseManager:
         """Get email-job link by ID"""
         session = self.get_session()
         try:
-            link = session.query(EmailJobLink).filter(EmailJobLink.id == link_id).first()
-            return link.to_dict() if link else None
+            row = session.execute(
+                select(*_LINK_COLUMNS).where(EmailJobLink.id == link_id)
+            ).one_or_none()
+            return EmailJobLink.row_to_dict(row) if row else None
         except SQLAlchemyError as e:
             logger.error(f"Error getting email-job link {link_id}: {e}")
             return None
@@ -718,30 +1469,32 @@ class DatabaseManager:
         """Get email-job links with filtering"""
         session = self.get_session()
         try:
-            query = session.query(EmailJobLink)
+            stmt = lambda_stmt(lambda: select(EmailJobLink))
             
             if job_id:
-                query = query.filter(EmailJobLink.job_id == job_id)
+                stmt += lambda s: s.where(EmailJobLink.job_id == job_id)
             
             if email_id:
-                query = query.filter(EmailJobLink.email_id == email_id)
+                stmt += lambda s: s.where(EmailJobLink.email_id == email_id)
             
             if link_type:
-                query = query.filter(EmailJobLink.link_type == link_type)
+                stmt += lambda s: s.where(EmailJobLink.link_type == link_type)
             
             if is_verified is not None:
-                query = query.filter(EmailJobLink.is_verified == is_verified)
+                stmt += lambda s: s.where(EmailJobLink.is_verified == is_verified)
             
             if min_confidence:
-                query = query.filter(EmailJobLink.confidence_score >= min_confidence)
+                stmt += lambda s: s.where(EmailJobLink.confidence_score >= min_confidence)
             
             # Exclude rejected links by default
-            query = query.filter(EmailJobLink.is_rejected == False)
+            stmt += lambda s: s.where(EmailJobLink.is_rejected == False)
             
             # Order by confidence and creation date
-            query = query.order_by(EmailJobLink.confidence_score.desc(), EmailJobLink.created_at.desc())
+            stmt += lambda s: s.order_by(EmailJobLink.confidence_score.desc(), EmailJobLink.created_at.desc())
+            
+            stmt += lambda s: s.limit(limit)
             
-            return query.limit(limit).all()
+            return session.execute(stmt).scalars().all()
             
         except SQLAlchemyError as e:
             logger.error(f"Error getting email-job links: {e}")
@@ -759,41 +1512,111 @@ class DatabaseManager:
         Returns:
             List of email-job links
         """
-        session = self.get_session()
-        try:
-            links = session.query(EmailJobLink).filter(
-                EmailJobLink.job_id == job_id,
-                EmailJobLink.is_rejected == False
-            ).order_by(EmailJobLink.created_at.desc()).all()
-            
-            return [link.to_dict() for link in links]
+        async with self.get_async_session() as session:
+            try:
+                # Only dicts leave this method, so select columns rather than entities
+                result = await session.execute(
+                    select(*_LINK_COLUMNS).where(
+                        EmailJobLink.job_id == job_id,
+                        EmailJobLink.is_rejected == False
+                    ).order_by(EmailJobLink.created_at.desc())
+                )
+                
+                return [EmailJobLink.row_to_dict(row) for row in result]
+                
+            except SQLAlchemyError as e:
+                logger.error(f"Error getting email links for job {job_id}: {e}")
+                return []
+
+    async def reassign_email_job_links(
+        self, from_job_id: int, to_job_id: int, session: Optional[AsyncSession] = None
+    ) -> int:
+        """
+        Point the active email links of one job application at another
+        
+        Used when merging duplicates; a single UPDATE moves every link instead
+        of loading the links and updating them one by one. Links that cannot
+        move (rejected ones, and emails the target is already linked to) are
+        deleted, so the source application is left with no links and can be
+        deleted in the same transaction.
+        
+        Args:
+            from_job_id: Job application the links currently belong to
+            to_job_id: Job application that takes over the links
+            session: As in update_application_notes
             
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting email links for job {job_id}: {e}")
-            return []
-        finally:
-            session.close()
+        Returns:
+            Number of links moved
+        """
+        if session is not None:
+            return await self._reassign_email_job_links(session, from_job_id, to_job_id)
+        
+        async with self.get_async_session() as session:
+            try:
+                moved = await self._reassign_email_job_links(session, from_job_id, to_job_id)
+                await session.commit()
+                
+                if session.info.pop("statistics_changed", False):
+                    _invalidate_statistics_cache()
+                return moved
+                
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"Error moving email links from job {from_job_id} to job {to_job_id}: {e}")
+                return 0
+
+    async def _reassign_email_job_links(self, session: AsyncSession, from_job_id: int, to_job_id: int) -> int:
+        """Move active email links between applications on the given session without committing"""
+        result = await session.execute(
+            update(EmailJobLink).where(
+                EmailJobLink.job_id == from_job_id,
+                EmailJobLink.is_rejected == False,
+                # Skip emails already linked to the target; the pair must stay unique
+                EmailJobLink.email_id.not_in(
+                    select(EmailJobLink.email_id).where(EmailJobLink.job_id == to_job_id)
+                )
+            ).values(job_id=to_job_id, updated_at=func.now())
+        )
+        moved = result.rowcount
+        
+        # Whatever is left would dangle once the source application is deleted
+        result = await session.execute(
+            delete(EmailJobLink).where(EmailJobLink.job_id == from_job_id)
+        )
+        if result.rowcount:
+            session.info["statistics_changed"] = True
+        
+        logger.info(
+            f"Moved {moved} email links from job {from_job_id} to job {to_job_id}, "
+            f"dropped {result.rowcount}"
+        )
+        return moved
 
     def update_email_job_link(self, link_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an email-job link"""
         session = self.get_session()
         try:
-            link = session.query(EmailJobLink).filter(EmailJobLink.id == link_id).first()
-            
-            if not link:
+            # Only real columns can be set; anything else in update_data is ignored as before
+            values = {field: value for field, value in update_data.items() if field in _LINK_COLUMN_NAMES}
+            values["updated_at"] = func.now()
+            
+            # One UPDATE ... RETURNING plain columns instead of loading the row first
+            row = session.execute(
+                update(EmailJobLink)
+                .where(EmailJobLink.id == link_id)
+                .values(**values)
+                .returning(*_LINK_COLUMNS)
+            ).one_or_none()
+            
+            if not row:
                 return None
             
-            # Update fields
-            for field, value in update_data.items():
-                if hasattr(link, field):
-                    setattr(link, field, value)
-            
-            link.updated_at = datetime.now()
+            link_data = EmailJobLink.row_to_dict(row)
             session.commit()
-            session.refresh(link)
+            _invalidate_statistics_cache()
             
             logger.info(f"Updated email-job link {link_id}")
-            return link.to_dict()
+            return link_data
             
         except SQLAlchemyError as e:
             session.rollback()
@@ -806,11 +1629,14 @@ class DatabaseManager:
         """Delete an email-job link"""
         session = self.get_session()
         try:
-            link = session.query(EmailJobLink).filter(EmailJobLink.id == link_id).first()
+            # Plain DELETE; rowcount tells whether the link existed
+            result = session.execute(
+                delete(EmailJobLink).where(EmailJobLink.id == link_id)
+            )
+            session.commit()
             
-            if link:
-                session.delete(link)
-                session.commit()
+            if result.rowcount > 0:
+                _invalidate_statistics_cache()
                 logger.info(f"Deleted email-job link {link_id}")
                 return True
             return False
@@ -822,54 +1648,65 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def get_linked_emails_for_job(self, job_id: int) -> List[Dict[str, Any]]:
-        """Get all emails linked to a specific job"""
-        session = self.get_session()
-        try:
-            links = session.query(EmailJobLink).filter(
-                and_(
-                    EmailJobLink.job_id == job_id,
-                    EmailJobLink.is_rejected == False
+    def get_linked_emails_for_job(self, job_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the emails linked to a specific job
+
+        Rows are streamed in batches, so callers that need a list should wrap
+        the result in list().
+        """
+        with self.session_scope() as session:
+            try:
+                # Keep the outer join: the stored email comes back on the same row as
+                # its link, so streaming never issues a per-link or per-batch load
+                result = session.execute(
+                    select(EmailJobLink, EmailRecord).outerjoin(
+                        EmailRecord, EmailRecord.email_id == EmailJobLink.email_id
+                    ).where(
+                        and_(
+                            EmailJobLink.job_id == job_id,
+                            EmailJobLink.is_rejected == False
+                        )
+                    ).execution_options(yield_per=200)
                 )
-            ).all()
-            
-            linked_emails = []
-            for link in links:
-                # Get email details - placeholder for now
-                email_data = {
-                    "email_id": link.email_id,
-                    "subject": "Email subject placeholder",
-                    "sender": "sender@example.com",
-                    "date": link.created_at.isoformat(),
-                    "link_info": link.to_dict()
-                }
-                linked_emails.append(email_data)
-            
-            return linked_emails
-            
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting linked emails for job {job_id}: {e}")
-            return []
-        finally:
-            session.close()
+
+                for link, record in result:
+                    # Fall back to placeholders for emails that were never stored
+                    yield {
+                        "email_id": link.email_id,
+                        "subject": record.subject if record else "Email subject placeholder",
+                        "sender": record.sender_email if record else "sender@example.com",
+                        "date": record.date_sent.isoformat() if record and record.date_sent else link.created_at.isoformat(),
+                        "link_info": link.to_dict()
+                    }
+
+            except SQLAlchemyError as e:
+                logger.error(f"Error getting linked emails for job {job_id}: {e}")
 
     def get_linked_jobs_for_email(self, email_id: str) -> List[Dict[str, Any]]:
         """Get all jobs linked to a specific email"""
         session = self.get_session()
         try:
-            query = session.query(EmailJobLink, JobApplication).join(
-                JobApplication, EmailJobLink.job_id == JobApplication.id
-            ).filter(
-                and_(
-                    EmailJobLink.email_id == email_id,
-                    EmailJobLink.is_rejected == False
+            # Plain column bundles: no entities are hydrated or tracked, and
+            # each row serializes straight into the same dicts as to_dict
+            rows = session.execute(
+                select(
+                    Bundle("job", *_APPLICATION_COLUMNS),
+                    Bundle("link", *_LINK_COLUMNS),
+                ).join_from(
+                    EmailJobLink, JobApplication, EmailJobLink.job_id == JobApplication.id
+                ).where(
+                    and_(
+                        EmailJobLink.email_id == email_id,
+                        EmailJobLink.is_rejected == False
+                    )
                 )
-            )
+            ).all()
             
             linked_jobs = []
-            for link, job in query.all():
-                job_data = job.to_dict()
-                job_data["link_info"] = link.to_dict()
+            for row in rows:
+                job_data = JobApplication.row_to_dict(row.job)
+                job_data["link_info"] = EmailJobLink.row_to_dict(row.link)
                 linked_jobs.append(job_data)
             
             return linked_jobs
@@ -889,7 +1726,6 @@ class DatabaseManager:
             email_record = EmailRecord(**email_data)
             session.add(email_record)
             session.commit()
-            session.refresh(email_record)
             logger.info(f"Saved email record: {email_data.get('email_id')}")
             return email_record.id
         except SQLAlchemyError as e:
@@ -903,7 +1739,9 @@ class DatabaseManager:
         """Get email record by email ID"""
         session = self.get_session()
         try:
-            email = session.query(EmailRecord).filter(EmailRecord.email_id == email_id).first()
+            email = session.execute(
+                select(EmailRecord).where(EmailRecord.email_id == email_id)
+            ).scalar_one_or_none()
             return email
         except SQLAlchemyError as e:
             logger.error(f"Error getting email record {email_id}: {e}")
@@ -945,37 +1783,32 @@ class DatabaseManager:
         """
         session = self.get_session()
         try:
-            from sqlalchemy import func
-            
-            # Find applications with same company and position
-            duplicates = session.query(
-                JobApplication.company,
-                JobApplication.position,
-                func.count(JobApplication.id).label('count'),
-                func.group_concat(JobApplication.id).label('ids')
-            ).group_by(
-                JobApplication.company, 
-                JobApplication.position
-            ).having(
-                func.count(JobApplication.id) > 1
+            # Size each (company, position) group with a window count over the
+            # narrow id columns, then load the members of larger groups in the
+            # same statement; no id lists are aggregated or parsed
+            group_sizes = select(
+                JobApplication.id,
+                func.count().over(
+                    partition_by=(JobApplication.company, JobApplication.position)
+                ).label("group_size"),
+            ).subquery()
+            rows = session.execute(
+                select(*_APPLICATION_COLUMNS)
+                .join_from(JobApplication, group_sizes, group_sizes.c.id == JobApplication.id)
+                .where(group_sizes.c.group_size > 1)
+                .order_by(JobApplication.company, JobApplication.position, JobApplication.id)
             ).all()
             
-            duplicate_groups = []
-            for dup in duplicates:
-                if dup.count > 1:
-                    ids = [int(id_str) for id_str in dup.ids.split(',')]
-                    apps = session.query(JobApplication).filter(
-                        JobApplication.id.in_(ids)
-                    ).all()
-                    
-                    duplicate_groups.append({
-                        'company': dup.company,
-                        'position': dup.position,
-                        'count': dup.count,
-                        'applications': [app.to_dict() for app in apps]
-                    })
-            
-            return duplicate_groups
+            duplicates = []
+            for (company, position), group in groupby(rows, key=lambda row: (row.company, row.position)):
+                applications = [JobApplication.row_to_dict(row) for row in group]
+                duplicates.append({
+                    'company': company,
+                    'position': position,
+                    'count': len(applications),
+                    'applications': applications
+                })
+            return duplicates
             
         except SQLAlchemyError as e:
             logger.error(f"Error finding duplicate applications: {e}")
@@ -983,22 +1816,28 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def get_unmatched_emails(self, limit: int = 100) -> List[EmailRecord]:
-        """Get emails that don't have matches yet"""
-        session = self.get_session()
-        try:
-            emails = session.query(EmailRecord).filter(
-                and_(
-                    EmailRecord.is_job_related == True,
-                    EmailRecord.has_matches == False
-                )
-            ).order_by(EmailRecord.date_received.desc()).limit(limit).all()
-            return emails
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting unmatched emails: {e}")
-            return []
-        finally:
-            session.close()
+    def get_unmatched_emails(self, limit: Optional[int] = 100) -> Iterator[EmailRecord]:
+        """
+        Iterate over job-related emails that don't have matches yet, newest first
+
+        Rows are streamed in batches, so a limit of None scans every unmatched
+        email in bounded memory; callers that need a list should wrap the
+        result in list().
+        """
+        with self.session_scope() as session:
+            try:
+                stmt = select(EmailRecord).where(
+                    and_(
+                        EmailRecord.is_job_related == True,
+                        EmailRecord.has_matches == False
+                    )
+                ).order_by(EmailRecord.date_received.desc())
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                
+                yield from session.execute(stmt.execution_options(yield_per=500)).scalars()
+            except SQLAlchemyError as e:
+                logger.error(f"Error getting unmatched emails: {e}")
 
     # MATCHING STATISTICS
 
@@ -1011,18 +1850,18 @@ class DatabaseManager:
         """Count email-job links with optional filters"""
         session = self.get_session()
         try:
-            query = session.query(EmailJobLink)
+            stmt = lambda_stmt(lambda: select(func.count(EmailJobLink.id)))
             
             if is_verified is not None:
-                query = query.filter(EmailJobLink.is_verified == is_verified)
+                stmt += lambda s: s.where(EmailJobLink.is_verified == is_verified)
             
             if is_rejected is not None:
-                query = query.filter(EmailJobLink.is_rejected == is_rejected)
+                stmt += lambda s: s.where(EmailJobLink.is_rejected == is_rejected)
             
             if link_type:
-                query = query.filter(EmailJobLink.link_type == link_type)
+                stmt += lambda s: s.where(EmailJobLink.link_type == link_type)
             
-            return query.count()
+            return session.execute(stmt).scalar_one()
             
         except SQLAlchemyError as e:
             logger.error(f"Error counting email-job links: {e}")
@@ -1034,28 +1873,8 @@ class DatabaseManager:
         """Get distribution of link confidence scores"""
         session = self.get_session()
         try:
-            # Define confidence ranges
-            ranges = {
-                "very_low": (0, 30),
-                "low": (30, 50),
-                "medium": (50, 70),
-                "high": (70, 85),
-                "very_high": (85, 100)
-            }
-            
-            distribution = {}
-            for range_name, (min_conf, max_conf) in ranges.items():
-                count = session.query(EmailJobLink).filter(
-                    and_(
-                        EmailJobLink.confidence_score >= min_conf,
-                        EmailJobLink.confidence_score < max_conf,
-                        EmailJobLink.is_rejected == False
-                    )
-                ).count()
-                distribution[range_name] = count
-            
-            return distribution
-            
+            row = self._link_statistics(session)
+            return {bucket: row._mapping[bucket] or 0 for bucket in CONFIDENCE_BUCKETS}
         except SQLAlchemyError as e:
             logger.error(f"Error getting confidence distribution: {e}")
             return {}
@@ -1066,10 +1885,7 @@ class DatabaseManager:
         """Get average confidence score of all links"""
         session = self.get_session()
         try:
-            avg = session.query(func.avg(EmailJobLink.confidence_score)).filter(
-                EmailJobLink.is_rejected == False
-            ).scalar()
-            return round(float(avg or 0), 1)
+            return round(float(self._link_statistics(session).average_confidence or 0), 1)
         except SQLAlchemyError as e:
             logger.error(f"Error getting average confidence: {e}")
             return 0.0
@@ -1080,15 +1896,8 @@ class DatabaseManager:
         """Get percentage of high confidence links (>= 75%)"""
         session = self.get_session()
         try:
-            total = session.query(EmailJobLink).filter(EmailJobLink.is_rejected == False).count()
-            high_conf = session.query(EmailJobLink).filter(
-                and_(
-                    EmailJobLink.confidence_score >= 75.0,
-                    EmailJobLink.is_rejected == False
-                )
-            ).count()
-            
-            return round((high_conf / total * 100) if total > 0 else 0, 1)
+            row = self._link_statistics(session)
+            return round((row.high_confidence or 0) / row.total * 100, 1) if row.total else 0.0
             
         except SQLAlchemyError as e:
             logger.error(f"Error getting high confidence percentage: {e}")
@@ -1096,122 +1905,229 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def _link_statistics(self, session: Session):
+        """
+        Aggregate non-rejected links in a single scan: total, verified,
+        high-confidence, average confidence and the confidence buckets.
+
+        The public link helpers above each open their own session; statistics
+        code that already has a session should use this row instead.
+        """
+        return session.execute(
+            lambda_stmt(lambda: select(
+                func.count(EmailJobLink.id).label("total"),
+                _count_where(EmailJobLink.is_verified == True, "verified"),
+                _count_where(EmailJobLink.confidence_score >= 75.0, "high_confidence"),
+                func.avg(EmailJobLink.confidence_score).label("average_confidence"),
+                *_confidence_bucket_columns()
+            ).where(EmailJobLink.is_rejected == False))
+        ).one()
+
     # ENHANCED STATISTICS
 
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive application statistics including matching data"""
-        session = self.get_session()
-        try:
-            now = datetime.now()
-            today_date = now.date()
-            this_week_start = today_date - timedelta(days=today_date.weekday())
-            this_month_start = today_date.replace(day=1)
-            
-            # Get basic application statistics (existing functionality)
-            total = session.query(JobApplication).count()
-            today_count = session.query(JobApplication).filter(
-                func.date(JobApplication.application_date) == today_date
-            ).count()
-            this_week = session.query(JobApplication).filter(
-                func.date(JobApplication.application_date) >= this_week_start
-            ).count()
-            this_month = session.query(JobApplication).filter(
-                func.date(JobApplication.application_date) >= this_month_start
-            ).count()
-            
-            # Status distribution
-            status_counts = {}
-            for status in ["applied", "interview", "offer", "rejected", "assessment", "screening", "captured"]:
-                count = session.query(JobApplication).filter(JobApplication.status == status).count()
-                status_counts[status] = count
-
-            # Source type distribution  
-            extension_count = session.query(JobApplication).filter(JobApplication.source_type == "extension").count()
-            email_count = session.query(JobApplication).filter(JobApplication.source_type == "email").count()
-            
-            # Job board distribution
-            job_board_stats = session.query(
-                JobApplication.job_board,
-                func.count(JobApplication.id).label('count')
-            ).filter(JobApplication.source_type == "extension").group_by(JobApplication.job_board).all()
-            job_board_distribution = {board: count for board, count in job_board_stats}
-
-            # Matching statistics
-            total_links = session.query(EmailJobLink).filter(EmailJobLink.is_rejected == False).count()
-            verified_links = session.query(EmailJobLink).filter(
-                and_(EmailJobLink.is_verified == True, EmailJobLink.is_rejected == False)
-            ).count()
-            high_confidence_links = session.query(EmailJobLink).filter(
-                and_(EmailJobLink.confidence_score >= 75.0, EmailJobLink.is_rejected == False)
-            ).count()
-
-            # Calculate rates
-            interview_rate = (status_counts.get("interview", 0) / total * 100) if total > 0 else 0
-            response_rate = ((status_counts.get("interview", 0) + status_counts.get("rejected", 0)) / total * 100) if total > 0 else 0
-            link_rate = (total_links / extension_count * 100) if extension_count > 0 else 0
+        """
+        Get comprehensive application statistics including matching data
+        
+        Results are cached for settings.statistics_cache_ttl seconds. When the
+        TTL runs out, a cheap version query decides whether anything changed
+        (including writes from other processes) before recomputing.
+        """
+        if _statistics_cache["value"] is not None and time.monotonic() < _statistics_cache["expires_at"]:
+            return _statistics_cache["value"]
+        
+        async with _statistics_lock():
+            # Another request may have refreshed the cache while this one waited
+            if _statistics_cache["value"] is not None and time.monotonic() < _statistics_cache["expires_at"]:
+                return _statistics_cache["value"]
             
-            # Average per day
-            thirty_days_ago = now - timedelta(days=30)
-            recent_applications = session.query(JobApplication).filter(JobApplication.application_date >= thirty_days_ago).count()
-            avg_per_day = recent_applications / 30 if recent_applications > 0 else 0
+            generation = _statistics_cache["generation"]
+            async with self.get_async_session() as session:
+                try:
+                    key = await session.run_sync(self._statistics_key)
+                    if _statistics_cache["value"] is not None and key == _statistics_cache["key"]:
+                        statistics = _statistics_cache["value"]
+                    else:
+                        statistics = await self._compute_statistics(session)
+                except SQLAlchemyError as e:
+                    logger.error(f"Error getting statistics: {e}")
+                    return {
+                        "total": 0, "today": 0, "thisWeek": 0, "thisMonth": 0,
+                        "avgPerDay": 0, "topCompanies": [], "statusDistribution": {},
+                        "byStatus": {}, "interviewRate": 0, "responseRate": 0,
+                        "sourceDistribution": {"extension": 0, "email": 0, "manual": 0},
+                        "jobBoardDistribution": {}, "extensionCaptureRate": 0,
+                        "matching": {
+                            "total_links": 0, "verified_links": 0, "high_confidence_links": 0,
+                            "link_rate": 0, "verification_rate": 0, "average_confidence": 0,
+                            "confidence_distribution": {}
+                        }
+                    }
+            
+            # A write invalidated the cache mid-computation; the result may predate it
+            if settings.statistics_cache_ttl > 0 and _statistics_cache["generation"] == generation:
+                _statistics_cache["value"] = statistics
+                _statistics_cache["key"] = key
+                _statistics_cache["expires_at"] = time.monotonic() + settings.statistics_cache_ttl
+            return statistics
+
+    def _statistics_key(self, session: Session) -> Tuple:
+        """
+        Version of the data behind get_statistics
+        
+        Row counts catch inserts and deletes; the newest updated_at catches
+        updates, since every write path stamps it. The current hour is part of
+        the key so the day, week and 30-day windows still move on. Each MAX is
+        its own subquery, so it is a single seek to the end of the updated_at
+        index, and the count scans only that narrow index.
+        """
+        application_version = lambda_stmt(lambda: select(
+            select(func.count()).select_from(JobApplication).scalar_subquery(),
+            select(func.max(JobApplication.updated_at)).scalar_subquery(),
+        ))
+        link_version = lambda_stmt(lambda: select(
+            select(func.count()).select_from(EmailJobLink).scalar_subquery(),
+            select(func.max(EmailJobLink.updated_at)).scalar_subquery(),
+        ))
+        return (
+            datetime.now().replace(minute=0, second=0, microsecond=0),
+            tuple(session.execute(application_version).one()),
+            tuple(session.execute(link_version).one()),
+        )
 
-            # Top companies
-            top_companies_query = session.query(
+    def _application_counts(self, session: Session) -> Dict[str, int]:
+        """Application counters, status and source distribution in one pass"""
+        now = datetime.now()
+        # Day boundaries as datetimes, so the column is compared as stored
+        # instead of passing every row through date()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        tomorrow_start = today_start + timedelta(days=1)
+        this_week_start = today_start - timedelta(days=today_start.weekday())
+        this_month_start = today_start.replace(day=1)
+
+        thirty_days_ago = now - timedelta(days=30)
+
+        # Cached by lambda_stmt: only the window bounds change between calls
+        counts = session.execute(
+            lambda_stmt(lambda: select(
+                func.count(JobApplication.id).label("total"),
+                _count_where(
+                    and_(JobApplication.application_date >= today_start, JobApplication.application_date < tomorrow_start),
+                    "today"
+                ),
+                _count_where(JobApplication.application_date >= this_week_start, "this_week"),
+                _count_where(JobApplication.application_date >= this_month_start, "this_month"),
+                _count_where(JobApplication.application_date >= thirty_days_ago, "recent"),
+                *_SOURCE_AND_STATUS_COUNT_COLUMNS
+            ))
+        ).one()._mapping
+        return {name: value or 0 for name, value in counts.items()}
+
+    def _company_and_job_board_counts(self, session: Session) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Top five companies and extension captures per job board
+        
+        Both come from one grouped scan over (company, job_board) instead of
+        scanning the table twice. There is a row per company and job board, so
+        the result grows with the number of distinct companies; it cannot be
+        limited in SQL because the job board totals need every group.
+        """
+        rows = session.execute(
+            lambda_stmt(lambda: select(
                 JobApplication.company,
-                func.count(JobApplication.id).label('count')
-            ).group_by(JobApplication.company).order_by(func.count(JobApplication.id).desc()).limit(5)
-            top_companies = [{"company": company, "count": count} for company, count in top_companies_query]
-
-            return {
-                # Basic statistics
-                "total": total,
-                "today": today_count,
-                "thisWeek": this_week,
-                "thisMonth": this_month,
-                "avgPerDay": round(avg_per_day, 1),
-                "topCompanies": top_companies,
-                "statusDistribution": status_counts,
-                "byStatus": status_counts,
-                "interviewRate": round(interview_rate, 1),
-                "responseRate": round(response_rate, 1),
-                
-                # Source distribution
-                "sourceDistribution": {
-                    "extension": extension_count,
-                    "email": email_count,
-                    "manual": max(0, total - extension_count - email_count)
-                },
-                "jobBoardDistribution": job_board_distribution,
-                "extensionCaptureRate": round((extension_count / total * 100) if total > 0 else 0, 1),
-                
-                # NEW: Email-job matching statistics
-                "matching": {
-                    "total_links": total_links,
-                    "verified_links": verified_links,
-                    "high_confidence_links": high_confidence_links,
-                    "link_rate": round(link_rate, 1),
-                    "verification_rate": round((verified_links / total_links * 100) if total_links > 0 else 0, 1),
-                    "average_confidence": self.get_average_link_confidence(),
-                    "confidence_distribution": self.get_link_confidence_distribution()
-                }
-            }
+                JobApplication.job_board,
+                func.count(JobApplication.id).label("count"),
+                _count_where(JobApplication.source_type == "extension", "extension"),
+            ).group_by(JobApplication.company, JobApplication.job_board).order_by(JobApplication.company))
+        ).all()
+        
+        company_counts = Counter()
+        job_board_distribution = Counter()
+        for row in rows:
+            company_counts[row.company] += row.count
+            if row.extension:
+                job_board_distribution[row.job_board] += row.extension
+        
+        # Stable, so companies with equal counts stay in name order
+        top_companies = heapq.nlargest(5, company_counts.items(), key=lambda item: item[1])
+        return (
+            [{"company": company, "count": count} for company, count in top_companies],
+            dict(job_board_distribution),
+        )
 
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting statistics: {e}")
-            return {
-                "total": 0, "today": 0, "thisWeek": 0, "thisMonth": 0,
-                "avgPerDay": 0, "topCompanies": [], "statusDistribution": {},
-                "byStatus": {}, "interviewRate": 0, "responseRate": 0,
-                "sourceDistribution": {"extension": 0, "email": 0, "manual": 0},
-                "jobBoardDistribution": {}, "extensionCaptureRate": 0,
-                "matching": {
-                    "total_links": 0, "verified_links": 0, "high_confidence_links": 0,
-                    "link_rate": 0, "verification_rate": 0, "average_confidence": 0,
-                    "confidence_distribution": {}
+    async def _compute_statistics(self, session: AsyncSession) -> Dict[str, Any]:
+        """
+        Run the statistics queries for get_statistics
+        
+        The aggregates do not depend on each other, so they overlap: the first
+        reuses the caller's session and each of the rest gets its own, since a
+        session runs one statement at a time.
+        """
+        async def run(query):
+            async with self.get_async_session() as extra_session:
+                return await extra_session.run_sync(query)
+
+        counts, (top_companies, job_board_distribution), link_counts = await asyncio.gather(
+            session.run_sync(self._application_counts),
+            run(self._company_and_job_board_counts),
+            run(self._link_statistics),
+        )
+
+        total = counts["total"]
+        status_counts = {status: counts[status] for status in STATISTICS_STATUSES}
+        extension_count = counts["extension"]
+        email_count = counts["email"]
+
+        total_links = link_counts.total
+        verified_links = link_counts.verified or 0
+        high_confidence_links = link_counts.high_confidence or 0
+
+        # Calculate rates
+        interview_rate = (status_counts.get("interview", 0) / total * 100) if total > 0 else 0
+        response_rate = ((status_counts.get("interview", 0) + status_counts.get("rejected", 0)) / total * 100) if total > 0 else 0
+        link_rate = (total_links / extension_count * 100) if extension_count > 0 else 0
+
+        # Average per day
+        recent_applications = counts["recent"]
+        avg_per_day = recent_applications / 30 if recent_applications > 0 else 0
+
+        statistics = {
+            # Basic statistics
+            "total": total,
+            "today": counts["today"],
+            "thisWeek": counts["this_week"],
+            "thisMonth": counts["this_month"],
+            "avgPerDay": round(avg_per_day, 1),
+            "topCompanies": top_companies,
+            "statusDistribution": status_counts,
+            "byStatus": status_counts,
+            "interviewRate": round(interview_rate, 1),
+            "responseRate": round(response_rate, 1),
+
+            # Source distribution
+            "sourceDistribution": {
+                "extension": extension_count,
+                "email": email_count,
+                "manual": max(0, total - extension_count - email_count)
+            },
+            "jobBoardDistribution": job_board_distribution,
+            "extensionCaptureRate": round((extension_count / total * 100) if total > 0 else 0, 1),
+
+            # NEW: Email-job matching statistics
+            "matching": {
+                "total_links": total_links,
+                "verified_links": verified_links,
+                "high_confidence_links": high_confidence_links,
+                "link_rate": round(link_rate, 1),
+                "verification_rate": round((verified_links / total_links * 100) if total_links > 0 else 0, 1),
+                "average_confidence": round(float(link_counts.average_confidence or 0), 1),
+                "confidence_distribution": {
+                    bucket: link_counts._mapping[bucket] or 0 for bucket in CONFIDENCE_BUCKETS
                 }
             }
-        finally:
-            session.close()
+        }
+        
+        return statistics
 
 
 # Create global instance
@@ -1,12 +1,24 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, \
-    Float, Text, ForeignKey
+    Float, Text, ForeignKey, Index, DDL, event
 from sqlalchemy.sql import func
 from datetime import datetime
+from operator import attrgetter
 import json
 
 Base = declarative_base()
 
+# Serialized application fields in to_dict order; the datetime ones are sent as ISO strings
+_APPLICATION_FIELDS = (
+    "id", "company", "position", "application_date", "status", "job_url",
+    "job_description", "salary_range", "location", "email_thread_id",
+    "email_subject", "email_sender", "calendar_event_id", "notes",
+    "created_at", "updated_at", "job_board", "captured_at", "applied_at",
+    "extraction_data", "source_type",
+)
+_APPLICATION_DATETIME_FIELDS = ("application_date", "created_at", "updated_at", "captured_at", "applied_at")
+_get_application_fields = attrgetter(*_APPLICATION_FIELDS)
+
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
@@ -35,33 +47,52 @@ class JobApplication(Base):
     extraction_data = Column(Text)
     source_type = Column(String, default="email")
 
+    # Fetch server-generated values (created_at, updated_at = now()) with
+    # RETURNING during the flush instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Keyset pagination in get_applications seeks on (created_at, id) newest first
+        Index("ix_job_applications_created_at_id", created_at.desc(), id.desc()),
+        # Source and status filters in listings and statistics, in the listing's
+        # (created_at, id) newest-first order so a filtered page stops at LIMIT
+        Index("ix_job_applications_source_type_created_at_id", source_type, created_at.desc(), id.desc()),
+        Index("ix_job_applications_status_created_at_id", status, created_at.desc(), id.desc()),
+        # get_applications_since seeks and sorts on the application date
+        Index("ix_job_applications_application_date", application_date),
+        # Duplicate detection and top companies group on these columns in index order
+        Index("ix_job_applications_company_position", company, position),
+        # The statistics version probe reads MAX(updated_at) from the end of the index
+        Index("ix_job_applications_updated_at", updated_at),
+        # Trigram indexes let PostgreSQL serve the ILIKE '%term%' searches without a scan
+        *[
+            Index(
+                f"ix_job_applications_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in ("company", "position", "location")
+        ],
+    )
+
     def to_dict(self):
         """Convert model to dictionary with enhanced fields"""
-        return {
-            "id": self.id,
-            "company": self.company,
-            "position": self.position,
-            "application_date": self.application_date.isoformat() if self.application_date else None,
-            "status": self.status,
-            "job_url": self.job_url,
-            "job_description": self.job_description,
-            "salary_range": self.salary_range,
-            "location": self.location,
-            "email_thread_id": self.email_thread_id,
-            "email_subject": self.email_subject,
-            "email_sender": self.email_sender,
-            "calendar_event_id": self.calendar_event_id,
-            "notes": self.notes,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "job_board": self.job_board,
-            "captured_at": self.captured_at.isoformat() if self.captured_at else None,
-            "applied_at": self.applied_at.isoformat() if self.applied_at else None,
-            "extraction_data": self.extraction_data,
-            "source_type": self.source_type,
-            "is_extension_captured": self.source_type == "extension",
-            "is_email_captured": self.source_type == "email",
-        }
+        return JobApplication.row_to_dict(self)
+
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """Serialize an application or a Core row selecting its columns like to_dict"""
+        # One C-level attrgetter call instead of an attribute lookup per key
+        data = dict(zip(_APPLICATION_FIELDS, _get_application_fields(row)))
+        for field in _APPLICATION_DATETIME_FIELDS:
+            value = data[field]
+            if value is not None:
+                data[field] = value.isoformat()
+        source_type = data["source_type"]
+        data["is_extension_captured"] = source_type == "extension"
+        data["is_email_captured"] = source_type == "email"
+        return data
     
     def is_extension_job(self) -> bool:
         """Check if this job was captured via browser extension"""
@@ -81,6 +112,14 @@ class JobApplication(Base):
             return "Manual Entry"
 
 
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class EmailProcessingLog(Base):
     __tablename__ = "email_processing_log"
     
@@ -137,9 +176,10 @@ class EmailJobLink(Base):
     """
     __tablename__ = "email_job_links"
     
-    id = Column(Integer, primary_key=True, index=True)
-    email_id = Column(String, nullable=False, index=True)  # Reference to email
-    job_id = Column(Integer, ForeignKey('job_applications.id'), nullable=False, index=True)
+    # email_id and job_id lookups are served by the composite indexes below
+    id = Column(Integer, primary_key=True)
+    email_id = Column(String, nullable=False)  # Reference to email
+    job_id = Column(Integer, ForeignKey('job_applications.id'), nullable=False)
     
     # Matching details
     confidence_score = Column(Float, nullable=False)  # 0-100% confidence
@@ -161,24 +201,50 @@ class EmailJobLink(Base):
     # Update tracking
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
+    __table_args__ = (
+        # One link per email and job; also the conflict target for link inserts
+        Index("uq_email_job_links_email_id_job_id", email_id, job_id, unique=True),
+        # Link lookups and statistics always exclude rejected links
+        Index("ix_email_job_links_job_id_is_rejected", job_id, is_rejected),
+        Index("ix_email_job_links_email_id_is_rejected", email_id, is_rejected),
+        # The statistics version probe reads MAX(updated_at) from the end of the index
+        Index("ix_email_job_links_updated_at", updated_at),
+        # Covers the statistics aggregate; partial, so rejected links take no space in it.
+        # is_rejected is carried too: SQLite only treats the index as covering when
+        # it holds every column the query mentions, including the WHERE one
+        Index(
+            "ix_email_job_links_active_confidence_score",
+            confidence_score,
+            is_verified,
+            is_rejected,
+            sqlite_where=is_rejected == False,
+            postgresql_where=is_rejected == False,
+        ),
+    )
+    
     def to_dict(self):
         """Convert model to dictionary"""
+        return EmailJobLink.row_to_dict(self)
+
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """Serialize a link or a Core row selecting its columns like to_dict"""
         return {
-            "id": self.id,
-            "email_id": self.email_id,
-            "job_id": self.job_id,
-            "confidence_score": self.confidence_score,
-            "match_methods": json.loads(self.match_methods) if self.match_methods else [],
-            "match_details": json.loads(self.match_details) if self.match_details else {},
-            "match_explanation": self.match_explanation,
-            "link_type": self.link_type,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "created_by": self.created_by,
-            "is_verified": self.is_verified,
-            "is_rejected": self.is_rejected,
-            "verified_at": self.verified_at.isoformat() if self.verified_at else None,
-            "verified_by": self.verified_by,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "id": row.id,
+            "email_id": row.email_id,
+            "job_id": row.job_id,
+            "confidence_score": row.confidence_score,
+            "match_methods": json.loads(row.match_methods) if row.match_methods else [],
+            "match_details": json.loads(row.match_details) if row.match_details else {},
+            "match_explanation": row.match_explanation,
+            "link_type": row.link_type,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "created_by": row.created_by,
+            "is_verified": row.is_verified,
+            "is_rejected": row.is_rejected,
+            "verified_at": row.verified_at.isoformat() if row.verified_at else None,
+            "verified_by": row.verified_by,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
         }
     
     def get_confidence_level(self) -> str:
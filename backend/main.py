@@ -31,14 +31,13 @@ import logging
 from contextlib import asynccontextmanager
 from services.websocket_manager import manager as websocket_manager
 from agent.email_monitor import EmailMonitor
-from database.database_manager import DatabaseManager
+from database.database_manager import db_manager
 from agent.email_processor import EmailProcessor
 from api.routes import applications, monitor, settings, statistics, jobs_capture, agents, monitoring, job_matching
 
 logger = logging.getLogger(__name__)
 
 # Initialize core services
-db_manager = DatabaseManager()
 email_processor = EmailProcessor()
 email_monitor = EmailMonitor(db_manager, email_processor)
 
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import asyncio
 from datetime import datetime, timedelta
 import random
 
@@ -10,7 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.database_manager import DatabaseManager
 
-def create_sample_data():
+async def create_sample_data():
     """Create sample job applications for development/testing"""
     
     db_manager = DatabaseManager()
@@ -56,7 +57,7 @@ def create_sample_data():
     ]
     
     # Generate sample applications
-    applications = []
+    rows = []
     for i in range(25):  # Create 25 sample applications
         company_data = random.choice(companies)
         company = company_data["name"]
@@ -83,17 +84,20 @@ def create_sample_data():
             "notes": f"Applied via company website. {random.choice(['Great company culture.', 'Interesting tech stack.', 'Good growth opportunities.', 'Competitive benefits.'])}" if random.random() > 0.7 else None
         }
         
-        try:
-            app_id = db_manager.add_application(application_data)
-            applications.append(app_id)
-            print(f"Added application {app_id}: {company} - {position}")
-        except Exception as e:
-            print(f"Error adding application for {company}: {e}")
+        rows.append(application_data)
+    
+    try:
+        applications = await db_manager.add_applications_bulk(rows)
+        for app_id, application_data in zip(applications, rows):
+            print(f"Added application {app_id}: {application_data['company']} - {application_data['position']}")
+    except Exception as e:
+        applications = []
+        print(f"Error adding sample applications: {e}")
     
     print(f"\nSuccessfully created {len(applications)} sample applications!")
     
     # Print statistics
-    stats = db_manager.get_statistics()
+    stats = await db_manager.get_statistics()
     print(f"\nDatabase Statistics:")
     print(f"Total applications: {stats['total']}")
     print(f"Applications by status:")
@@ -102,5 +106,7 @@ def create_sample_data():
     print(f"Interview rate: {stats['interviewRate']}%")
     print(f"Response rate: {stats['responseRate']}%")
 
+    await db_manager.close()
+
 if __name__ == "__main__":
-    create_sample_data()
\ No newline at end of file
+    asyncio.run(create_sample_data())
\ No newline at end of file
@@ -0,0 +1,338 @@
+"""
+Tests for the DatabaseManager class definition and its database behavior
+"""
+
+import ast
+import asyncio
+import inspect
+
+import pytest
+from sqlalchemy import inspect as inspect_database, select, text
+
+from config.settings import settings
+from database.database_manager import DatabaseManager
+from database.models import EmailJobLink, EmailProcessingLog, JobApplication
+import database.database_manager as database_manager_module
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """DatabaseManager on a fresh SQLite file, with lazy loads made strict"""
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path / 'test.db'}")
+    database_manager_module._invalidate_statistics_cache()
+    manager = DatabaseManager(strict_loads=True)
+    manager.init_db()
+    yield manager
+    asyncio.run(manager.close())
+    database_manager_module._invalidate_statistics_cache()
+
+
+def add_application(db, company="Acme", position="Engineer", **fields):
+    """Insert an application and return its ID"""
+    data = {"company": company, "position": position, "application_date": "2024-01-05", **fields}
+    return asyncio.run(db.add_application(data))
+
+
+def add_link(db, email_id, job_id, **fields):
+    """Create an email-job link and return its ID"""
+    return asyncio.run(db.create_email_job_link({"email_id": email_id, "job_id": job_id, **fields}))
+
+
+class TestDatabaseManagerDefinition:
+    """Guard against methods being shadowed by a later definition"""
+
+    def _method_names(self):
+        tree = ast.parse(inspect.getsource(database_manager_module))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == "DatabaseManager":
+                return [
+                    child.name for child in node.body
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                ]
+        return []
+
+    def test_get_statistics_defined_once(self):
+        members = [name for name, _ in inspect.getmembers(DatabaseManager) if name == "get_statistics"]
+        assert members == ["get_statistics"]
+        assert self._method_names().count("get_statistics") == 1
+
+    def test_no_duplicate_methods(self):
+        names = self._method_names()
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        assert duplicates == []
+
+
+class TestMergeDuplicates:
+    """Merging moves a duplicate's links to the primary before deleting it"""
+
+    def _merge(self, db, primary_id, duplicate_id):
+        async def merge():
+            async with db.async_session_scope() as session:
+                await db.reassign_email_job_links(duplicate_id, primary_id, session=session)
+                await db.delete_application(duplicate_id, session=session)
+        asyncio.run(merge())
+
+    def _links(self, db):
+        with db.session_scope() as session:
+            return sorted(session.execute(select(EmailJobLink.email_id, EmailJobLink.job_id)).all())
+
+    def test_no_links_left_on_duplicate(self, db):
+        primary_id = add_application(db)
+        duplicate_id = add_application(db)
+        add_link(db, "e1", primary_id)
+        add_link(db, "e1", duplicate_id)
+        add_link(db, "e2", duplicate_id)
+        add_link(db, "e3", duplicate_id, is_rejected=True)
+
+        self._merge(db, primary_id, duplicate_id)
+
+        assert self._links(db) == [("e1", primary_id), ("e2", primary_id)]
+        assert asyncio.run(db.get_application_by_id(duplicate_id)) is None
+        assert asyncio.run(db.get_statistics())["matching"]["total_links"] == 2
+
+
+class TestProcessedEmailCache:
+    """The processed-email cache keeps recent IDs and evicts the oldest first"""
+
+    def test_seeded_ids_survive_new_entries(self, db, monkeypatch):
+        monkeypatch.setattr(database_manager_module, "PROCESSED_CACHE_MAX_SIZE", 10)
+        monkeypatch.setattr(database_manager_module, "PROCESSED_CACHE_SEED_SIZE", 8)
+        email_ids = [f"seed-{n}" for n in range(20)]
+        asyncio.run(db.mark_emails_processed(email_ids))
+
+        # A restarted process seeds from the log: the 8 newest IDs, oldest first
+        restarted = DatabaseManager()
+        assert restarted.filter_processed([]) == set()
+        assert list(restarted._processed_email_ids) == email_ids[-8:]
+
+        # Remembering new IDs past the cap evicts only the oldest seeded ones
+        restarted._remember_processed(["new-1", "new-2", "new-3"])
+        cached = restarted._processed_email_ids
+        assert len(cached) == 10
+        assert "seed-12" not in cached and "seed-13" in cached
+        assert all(email_id in cached for email_id in email_ids[-7:])
+
+        # A cache hit refreshes the entry, so it outlives newer IDs
+        assert restarted.filter_processed(["seed-13"]) == {"seed-13"}
+        restarted._remember_processed(["new-4"])
+        assert "seed-13" in cached and "seed-14" not in cached
+        asyncio.run(restarted.close())
+
+
+class TestEngines:
+    """Both engines of a manager open the same database"""
+
+    def test_in_memory_url_shared_between_engines(self, monkeypatch):
+        monkeypatch.setattr(settings, "database_url", "sqlite://")
+        manager = DatabaseManager()
+        manager.init_db()
+        application_id = add_application(manager)
+
+        assert manager.get_application(application_id) is not None
+        assert asyncio.run(manager.get_application_by_id(application_id))["company"] == "Acme"
+        asyncio.run(manager.close())
+
+    def test_pool_split_between_engines(self):
+        options = database_manager_module._engine_options("postgresql://user@host/db")
+        assert 2 * (options["pool_size"] + options["max_overflow"]) <= settings.db_pool_size + settings.db_max_overflow
+
+
+class TestIndexMigration:
+    """init_db brings an existing database's indexes in line with the models"""
+
+    OLD_INDEXES = {
+        "ix_email_job_links_id": "email_job_links (id)",
+        "ix_email_job_links_email_id": "email_job_links (email_id)",
+        "ix_email_job_links_job_id": "email_job_links (job_id)",
+        "ix_email_job_links_confidence_score_is_rejected": "email_job_links (confidence_score, is_rejected)",
+        "ix_job_applications_status_created_at": "job_applications (status, created_at)",
+    }
+
+    def _index_names(self, manager):
+        with manager.engine.connect() as connection:
+            inspector = inspect_database(connection)
+            return {
+                table_name: {index["name"] for index in inspector.get_indexes(table_name)}
+                for table_name in ("email_job_links", "job_applications")
+            }
+
+    def test_replaced_indexes_are_dropped(self, db, tmp_path, monkeypatch):
+        with db.engine.begin() as connection:
+            for name, target in self.OLD_INDEXES.items():
+                connection.execute(text(f"CREATE INDEX {name} ON {target}"))
+
+        db.init_db()
+
+        # Same indexes as a database created from scratch
+        monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path / 'fresh.db'}")
+        fresh = DatabaseManager()
+        fresh.init_db()
+        assert self._index_names(db) == self._index_names(fresh)
+        asyncio.run(fresh.close())
+
+
+class TestStatisticsCacheConsistency:
+    """A recompute never caches results that a concurrent write made stale"""
+
+    def test_write_during_recompute_is_not_overwritten(self, db, monkeypatch):
+        monkeypatch.setattr(settings, "statistics_cache_ttl", 60)
+        compute = db._compute_statistics
+
+        async def compute_then_write(session):
+            statistics = await compute(session)
+            # A write lands after the aggregates were read
+            await db.add_application({"company": "Late", "position": "Engineer", "application_date": "2024-01-05"})
+            return statistics
+
+        monkeypatch.setattr(db, "_compute_statistics", compute_then_write)
+        assert asyncio.run(db.get_statistics())["total"] == 0
+        assert database_manager_module._statistics_cache["value"] is None
+
+        monkeypatch.setattr(db, "_compute_statistics", compute)
+        assert asyncio.run(db.get_statistics())["total"] == 1
+
+    def test_lock_works_on_each_event_loop(self, db, monkeypatch):
+        monkeypatch.setattr(settings, "statistics_cache_ttl", 0)
+
+        async def concurrent_statistics():
+            return await asyncio.gather(db.get_statistics(), db.get_statistics())
+
+        for _ in range(2):
+            assert [statistics["total"] for statistics in asyncio.run(concurrent_statistics())] == [0, 0]
+
+
+class TestStatisticsCache:
+    """get_statistics reuses results within the TTL and notices writes"""
+
+    @pytest.fixture(autouse=True)
+    def ttl(self, monkeypatch):
+        monkeypatch.setattr(settings, "statistics_cache_ttl", 60)
+
+    def test_write_invalidates_cache(self, db):
+        assert asyncio.run(db.get_statistics())["total"] == 0
+        application_id = add_application(db)
+        assert asyncio.run(db.get_statistics())["total"] == 1
+
+        asyncio.run(db.update_application_status(application_id, "interview"))
+        assert asyncio.run(db.get_statistics())["byStatus"]["interview"] == 1
+
+        asyncio.run(db.delete_application(application_id))
+        assert asyncio.run(db.get_statistics())["total"] == 0
+
+    def test_cached_until_expiry(self, db):
+        first = asyncio.run(db.get_statistics())
+        # A write from another process does not invalidate this process's cache
+        with db.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO job_applications (company, position, application_date) "
+                "VALUES ('Other', 'Engineer', '2024-01-05')"
+            ))
+        assert asyncio.run(db.get_statistics()) is first
+
+        # Once the TTL runs out, the version check sees the new row
+        database_manager_module._statistics_cache["expires_at"] = 0.0
+        assert asyncio.run(db.get_statistics())["total"] == 1
+
+    def test_unchanged_data_reuses_value_after_expiry(self, db):
+        add_application(db)
+        first = asyncio.run(db.get_statistics())
+        database_manager_module._statistics_cache["expires_at"] = 0.0
+        assert asyncio.run(db.get_statistics()) is first
+
+
+class TestConflictInserts:
+    """Inserts that hit an existing row return or skip it instead of failing"""
+
+    def _count(self, db, model, **filters):
+        with db.session_scope() as session:
+            return session.query(model).filter_by(**filters).count()
+
+    def test_marking_email_twice_logs_it_once(self, db):
+        asyncio.run(db.mark_emails_processed(["e1", "e1", "e2"]))
+        asyncio.run(db.mark_email_processed("e1"))
+        db.log_email_processing_bulk([
+            {"email_id": "e2", "is_job_related": False},
+            {"email_id": "e3", "is_job_related": False},
+        ])
+
+        assert self._count(db, EmailProcessingLog, email_id="e1") == 1
+        assert self._count(db, EmailProcessingLog, email_id="e2") == 1
+        assert self._count(db, EmailProcessingLog) == 3
+        assert DatabaseManager().filter_processed(["e1", "e3", "e4"]) == {"e1", "e3"}
+
+    def test_duplicate_link_returns_existing_id(self, db):
+        job_id = add_application(db)
+        link_id = add_link(db, "e1", job_id)
+
+        assert link_id is not None
+        assert add_link(db, "e1", job_id, confidence_score=90.0) == link_id
+        assert self._count(db, EmailJobLink) == 1
+
+    def test_links_without_unique_index(self, db):
+        job_id = add_application(db)
+        # A database that already held duplicate pairs cannot get the unique index
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX uq_email_job_links_email_id_job_id"))
+            for _ in range(2):
+                connection.execute(
+                    text("INSERT INTO email_job_links (email_id, job_id, confidence_score) VALUES ('e1', :job_id, 50.0)"),
+                    {"job_id": job_id},
+                )
+        db.init_db()
+        assert db._unique_link_index is False
+
+        with db.session_scope() as session:
+            existing_ids = set(session.execute(select(EmailJobLink.id)).scalars())
+        assert add_link(db, "e1", job_id) in existing_ids
+        new_link_id = add_link(db, "e2", job_id)
+        assert new_link_id not in existing_ids
+        assert add_link(db, "e2", job_id) == new_link_id
+        assert self._count(db, EmailJobLink) == 3
+
+
+class TestApplicationsPage:
+    """Offset and keyset pages of the applications listing"""
+
+    def _add_batch(self, db, count):
+        # One INSERT, so every row gets the same server-side created_at
+        return asyncio.run(db.add_applications_bulk([
+            {"company": f"Company {n}", "position": "Engineer", "application_date": "2024-01-05",
+             "job_description": "Long description", "notes": "Notes"}
+            for n in range(count)
+        ]))
+
+    def test_keyset_pages_across_equal_created_at(self, db):
+        application_ids = self._add_batch(db, 7)
+
+        seen, after = [], None
+        while True:
+            rows, total = asyncio.run(db.get_applications_page(limit=3, after=after))
+            assert total == 7
+            if not rows:
+                break
+            seen.extend(row.id for row in rows)
+            after = (rows[-1].created_at, rows[-1].id)
+
+        assert len({row.created_at for row in db.get_applications()}) == 1
+        assert seen == sorted(application_ids, reverse=True)
+
+    def test_offset_page_total(self, db):
+        self._add_batch(db, 5)
+        rows, total = asyncio.run(db.get_applications_page(skip=3, limit=3))
+        assert total == 5
+        assert len(rows) == 2
+
+    def test_summary_rows_leave_out_text_columns(self, db):
+        self._add_batch(db, 2)
+        full, _ = asyncio.run(db.get_applications_page(limit=2))
+        summary, _ = asyncio.run(db.get_applications_page(limit=2, summary=True))
+
+        text_columns = database_manager_module._APPLICATION_TEXT_COLUMN_NAMES
+        for full_row, summary_row in zip(full, summary):
+            full_dict = JobApplication.row_to_dict(full_row)
+            summary_dict = JobApplication.row_to_dict(summary_row)
+            assert full_dict["notes"] == "Notes"
+            assert summary_dict.keys() == full_dict.keys()
+            assert all(summary_dict[name] is None for name in text_columns)
+            assert {key: value for key, value in summary_dict.items() if key not in text_columns} == \
+                {key: value for key, value in full_dict.items() if key not in text_columns}
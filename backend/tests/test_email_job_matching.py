@@ -21,7 +21,7 @@ from agent.email_processor import EmailProcessor
 class EmailJobMatchingTests:
     
     def __init__(self):
-        self.db = DatabaseManager()
+        self.db = DatabaseManager(strict_loads=True)
         self.matcher = SmartEmailJobMatcher(self.db)
         self.passed = 0
         self.failed = 0
@@ -248,7 +248,7 @@ class EmailJobMatchingTests:
                 
                 if updated:
                     # Verify the status was actually updated
-                    app = self.db.get_application_by_id(job_id)
+                    app = await self.db.get_application_by_id(job_id)
                     correct_status = app and app.get('status') == status
                     
                     self.log_test(
@@ -0,0 +1,80 @@
+"""
+Tests for the cached name normalization used by SmartEmailJobMatcher
+"""
+
+import re
+
+import pytest
+
+from agent.smart_email_job_matcher import (
+    SmartEmailJobMatcher,
+    normalize_company_name,
+    normalize_position_title,
+)
+
+ORIGINAL_SUFFIXES = ['inc', 'llc', 'corp', 'corporation', 'company', 'ltd', 'limited']
+
+COMPANY_NAMES = [
+    "Google LLC",
+    "Alphabet Inc.",
+    "Johnson&Company",
+    "McKinsey & Company",
+    "Bain & Co",
+    "Acme® Corp™",
+    "  Initech,   Ltd  ",
+    "AT&T",
+    "Amazon.com",
+    "Société Générale",
+    "Tech Solutions Group",
+    "O'Reilly Media",
+    "Data—Driven “Systems”",
+    "",
+]
+
+POSITION_TITLES = [
+    "Senior Software Engineer Position",
+    "Data Scientist - Role",
+    "  Job Opening: Backend   Developer ",
+    "Product Manager (Opportunity)",
+]
+
+
+def reference_company_name(company, suffixes):
+    """The regex normalization the matcher used before caching, with the given suffixes"""
+    normalized = re.sub(r'\b(' + '|'.join(suffixes) + r')\b', '', company.lower())
+    normalized = re.sub(r'[^\w\s]', '', normalized)
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+
+def reference_position_title(position):
+    """The regex normalization the matcher used before caching"""
+    normalized = re.sub(r'\s+', ' ', position.lower().strip())
+    for word in ['position', 'role', 'job', 'opening', 'opportunity']:
+        normalized = re.sub(rf'\b{word}\b', '', normalized)
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+
+@pytest.mark.parametrize("company", COMPANY_NAMES)
+def test_company_name_matches_reference(company):
+    expected = reference_company_name(company, ORIGINAL_SUFFIXES)
+    assert normalize_company_name(company) == expected
+
+
+def test_company_suffixes_are_the_original_ones():
+    assert normalize_company_name("Acme Technologies") == "acme technologies"
+    assert normalize_company_name("Tech Solutions Group") == "tech solutions group"
+    assert normalize_company_name("Johnson&Company") == "johnson"
+    assert normalize_company_name("Acme® Corp™") == "acme"
+
+
+@pytest.mark.parametrize("email_company", ["Inc.", "LLC", "&"])
+def test_empty_normalized_company_never_matches(email_company):
+    matcher = SmartEmailJobMatcher(db_manager=None)
+    assert normalize_company_name(email_company) == ""
+    assert matcher._calculate_company_match(email_company, "Acme Corp") == 0.0
+    assert matcher._calculate_company_match("Acme Corp", email_company) == 0.0
+
+
+@pytest.mark.parametrize("position", POSITION_TITLES)
+def test_position_title_matches_reference(position):
+    assert normalize_position_title(position) == reference_position_title(position)